@@ -369,7 +369,7 @@ class CopyTradeDetector:
             })
 
         # Get all traders
-        all_traders = set(self.db.get_flagged_traders())
+        all_traders = self.db.get_flagged_trader_set()
 
         # Identify independents (no copy relationships)
         involved_traders = set(leaders.keys()) | set(followers.keys())
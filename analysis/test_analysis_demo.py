@@ -6,8 +6,12 @@ Shows how the analysis calculations work with sample data.
 Run this to verify the logic before running on real database.
 """
 
+import heapq
 from datetime import datetime
 
+# Rows shown in each ranking table
+TOP_K = 10
+
 
 def demo_pnl_calculation():
     """Demonstrate P&L calculation logic."""
@@ -105,11 +109,19 @@ def demo_metrics_calculation():
         {"resolved": True, "won": True, "pnl": 15.00, "invested": 85.00},   # Win
     ]
 
+    # One pass over the trades accumulates every metric
     total_trades = len(trader_trades)
-    resolved_trades = sum(1 for t in trader_trades if t['resolved'])
-    winning_trades = sum(1 for t in trader_trades if t.get('won') == True)
-    total_pnl = sum(t['pnl'] for t in trader_trades if t['resolved'])
-    total_invested = sum(t['invested'] for t in trader_trades if t['resolved'])
+    resolved_trades = 0
+    winning_trades = 0
+    total_pnl = 0
+    total_invested = 0
+    for t in trader_trades:
+        if t.get('won') == True:
+            winning_trades += 1
+        if t['resolved']:
+            resolved_trades += 1
+            total_pnl += t['pnl']
+            total_invested += t['invested']
 
     win_rate = (winning_trades / resolved_trades * 100) if resolved_trades > 0 else 0
     roi = (total_pnl / total_invested * 100) if total_invested > 0 else 0
@@ -186,21 +198,21 @@ def demo_ranking():
 
     print("🏆 TOP TRADERS BY WIN RATE")
     print("-"*70)
-    top_by_winrate = sorted(traders, key=lambda x: x['win_rate'], reverse=True)
+    top_by_winrate = heapq.nlargest(TOP_K, traders, key=lambda x: x['win_rate'])
     print(f"{'Rank':<6}{'Address':<18}{'Win Rate':<12}{'Resolved':<12}{'ROI':<12}")
     for i, t in enumerate(top_by_winrate, 1):
         print(f"{i:<6}{t['address']:<18}{t['win_rate']:>6.1f}%{t['resolved_trades']:>10}{t['roi']:>9.1f}%")
 
     print("\n💰 TOP TRADERS BY ROI")
     print("-"*70)
-    top_by_roi = sorted(traders, key=lambda x: x['roi'], reverse=True)
+    top_by_roi = heapq.nlargest(TOP_K, traders, key=lambda x: x['roi'])
     print(f"{'Rank':<6}{'Address':<18}{'ROI':<12}{'P&L':<15}{'Win Rate':<12}")
     for i, t in enumerate(top_by_roi, 1):
         print(f"{i:<6}{t['address']:<18}{t['roi']:>6.1f}%  ${t['total_pnl']:>10,.2f}{t['win_rate']:>9.1f}%")
 
     print("\n⭐ TOP TRADERS BY COMBINED SCORE")
     print("-"*70)
-    top_by_combined = sorted(traders, key=lambda x: x['combined_score'], reverse=True)
+    top_by_combined = heapq.nlargest(TOP_K, traders, key=lambda x: x['combined_score'])
     print(f"{'Rank':<6}{'Address':<18}{'Score':<12}{'Win Rate':<12}{'ROI':<12}")
     for i, t in enumerate(top_by_combined, 1):
         print(f"{i:<6}{t['address']:<18}{t['combined_score']:>6.2f}{t['win_rate']:>9.1f}%{t['roi']:>9.1f}%")
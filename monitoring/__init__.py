@@ -5,13 +5,14 @@ Core monitoring components for tracking geopolitical prediction markets.
 """
 
 from .database import Database
-from .polymarket_client import PolymarketClient
+from .polymarket_client import PolymarketClient, get_client
 from .trader_analyzer import TraderAnalyzer
 
 # Import components with external dependencies conditionally
 __all__ = [
     'Database',
     'PolymarketClient',
+    'get_client',
     'TraderAnalyzer',
 ]
 
@@ -2,10 +2,21 @@ import sqlite3
 import os
 import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 import json
 from functools import wraps
 
+# Markets with trades from (non-excluded) flagged traders that are still open.
+# Shared by the unresolved-market listing and its count.
+_UNRESOLVED_MARKETS_FROM = """
+    FROM markets m
+    INNER JOIN trades t ON m.market_id = t.market_id
+    INNER JOIN traders tr ON t.trader_address = tr.address
+    WHERE tr.is_flagged = 1
+    AND (tr.research_excluded = 0 OR tr.research_excluded IS NULL)
+    AND (m.resolved = 0 OR m.resolved IS NULL)
+"""
+
 
 def retry_on_locked(max_retries=3, delay=1):
     """Retry database operations on lock errors."""
@@ -233,6 +244,13 @@ class Database:
             ON trades(transaction_hash) WHERE transaction_hash IS NOT NULL AND transaction_hash != ''
         """)
 
+        # Index for add_trade()'s soft-dedup probe (trader, market, timestamp, ...)
+        # — without it every insert scans the whole trades table.
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_trades_trader_market_ts
+            ON trades(trader_address, market_id, timestamp)
+        """)
+
         # monitor_state table — persists key/value pairs across restarts
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS monitor_state (
@@ -269,6 +287,21 @@ class Database:
         conn.commit()
         conn.close()
 
+    _UPSERT_TRADER_SQL = """
+        INSERT INTO traders (address, total_trades, successful_trades, win_rate,
+                           total_volume, is_flagged, last_updated)
+        VALUES (?, ?, ?, COALESCE(?, 0.0), ?, ?, ?)
+        ON CONFLICT(address) DO UPDATE SET
+            total_trades = excluded.total_trades,
+            successful_trades = excluded.successful_trades,
+            win_rate = CASE WHEN excluded.win_rate IS NULL
+                            THEN traders.win_rate
+                            ELSE excluded.win_rate END,
+            total_volume = excluded.total_volume,
+            is_flagged = excluded.is_flagged,
+            last_updated = excluded.last_updated
+    """
+
     @retry_on_locked(max_retries=3, delay=1)
     def add_or_update_trader(self, address: str, total_trades: int,
                             successful_trades: int, win_rate: float = None,
@@ -282,27 +315,35 @@ class Database:
         conn = self.get_connection()
         cursor = conn.cursor()
 
-        cursor.execute("""
-            INSERT INTO traders (address, total_trades, successful_trades, win_rate,
-                               total_volume, is_flagged, last_updated)
-            VALUES (?, ?, ?, COALESCE(?, 0.0), ?, ?, ?)
-            ON CONFLICT(address) DO UPDATE SET
-                total_trades = excluded.total_trades,
-                successful_trades = excluded.successful_trades,
-                win_rate = CASE WHEN excluded.win_rate IS NULL
-                                THEN traders.win_rate
-                                ELSE excluded.win_rate END,
-                total_volume = excluded.total_volume,
-                is_flagged = excluded.is_flagged,
-                last_updated = excluded.last_updated
-        """, (address, total_trades, successful_trades, win_rate,
-              total_volume, is_flagged, datetime.now()))
+        cursor.execute(self._UPSERT_TRADER_SQL,
+                       (address, total_trades, successful_trades, win_rate,
+                        total_volume, is_flagged, datetime.now()))
 
         try:
             conn.commit()
         finally:
             conn.close()
 
+    @retry_on_locked(max_retries=3, delay=1)
+    def add_or_update_traders(self, rows: List[tuple]):
+        """
+        add_or_update_trader() for many traders in one transaction.
+
+        rows: (address, total_trades, successful_trades, win_rate,
+               total_volume, is_flagged) tuples; win_rate None preserves the
+               existing value, as in add_or_update_trader().
+        """
+        if not rows:
+            return
+        now = datetime.now()
+        conn = self.get_connection()
+        try:
+            conn.executemany(self._UPSERT_TRADER_SQL,
+                             [(*row, now) for row in rows])
+            conn.commit()
+        finally:
+            conn.close()
+
     def get_flagged_traders(self) -> List[str]:
         """Get list of all flagged trader addresses."""
         conn = self.get_connection()
@@ -314,6 +355,24 @@ class Database:
         conn.close()
         return traders
 
+    def get_flagged_trader_set(self, include_research_excluded: bool = False) -> set:
+        """
+        Same population as get_flagged_traders(), returned as a set for
+        membership filtering (built straight from the cursor, no list copy).
+
+        With include_research_excluded=True, every is_flagged = 1 address is
+        returned, research-excluded ones included.
+        """
+        query = "SELECT address FROM traders WHERE is_flagged = 1"
+        if not include_research_excluded:
+            query += " AND (research_excluded = 0 OR research_excluded IS NULL)"
+        conn = self.get_connection()
+        try:
+            cursor = conn.execute(query)
+            return {row[0] for row in cursor}
+        finally:
+            conn.close()
+
     @retry_on_locked(max_retries=3, delay=1)
     def add_trade(self, trade_id: str, trader_address: str, market_id: str,
                   market_title: str, market_category: str, outcome: str,
@@ -356,6 +415,26 @@ class Database:
         finally:
             conn.close()
 
+    def get_existing_trade_ids(self, trade_ids: List[str]) -> set:
+        """
+        Return the subset of trade_ids already stored, in one primary-key
+        lookup per 500 ids (kept under SQLite's bound-parameter limit).
+        """
+        existing = set()
+        if not trade_ids:
+            return existing
+        conn = self.get_connection()
+        try:
+            for i in range(0, len(trade_ids), 500):
+                chunk = trade_ids[i:i + 500]
+                ph = ','.join('?' * len(chunk))
+                existing.update(row[0] for row in conn.execute(
+                    f"SELECT trade_id FROM trades WHERE trade_id IN ({ph})", chunk
+                ))
+        finally:
+            conn.close()
+        return existing
+
     def insert_position(self, position):
         """
         Insert or update a position in the positions table.
@@ -471,6 +550,18 @@ class Database:
         finally:
             conn.close()
 
+    def mark_trades_notified(self, trade_ids: List[str]):
+        """Mark many trades as notified in one transaction."""
+        if not trade_ids:
+            return
+        conn = self.get_connection()
+        try:
+            conn.executemany("UPDATE trades SET notified = 1 WHERE trade_id = ?",
+                             [(trade_id,) for trade_id in trade_ids])
+            conn.commit()
+        finally:
+            conn.close()
+
     def get_unnotified_trades(self) -> List[Dict]:
         """Get all trades that haven't been notified yet."""
         conn = self.get_connection()
@@ -590,31 +681,44 @@ class Database:
         NOTE: Joins on condition_id because trades table uses conditionId in market_id field,
         while markets table now uses API-compatible ID in market_id field.
         """
-        conn = self.get_connection()
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        return list(self.iter_unresolved_markets())
 
-        cursor.execute("""
-            SELECT DISTINCT
-                m.market_id,
-                m.api_id,
-                m.title,
-                m.category,
-                m.end_date,
-                m.last_checked
-            FROM markets m
-            INNER JOIN trades t ON m.market_id = t.market_id
-            INNER JOIN traders tr ON t.trader_address = tr.address
-            WHERE tr.is_flagged = 1
-            AND (tr.research_excluded = 0 OR tr.research_excluded IS NULL)
-            AND (m.resolved = 0 OR m.resolved IS NULL)
-            ORDER BY m.last_checked ASC
-        """)
+    def iter_unresolved_markets(self, limit: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Stream the rows of get_unresolved_markets() one at a time.
 
-        markets = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        Rows are read from the cursor as they are consumed, so callers that
+        only need a sample (or `limit` rows) don't materialize the full list.
+        """
+        conn = self.get_connection()
+        conn.row_factory = sqlite3.Row
+        try:
+            cursor = conn.execute(f"""
+                SELECT DISTINCT
+                    m.market_id,
+                    m.api_id,
+                    m.title,
+                    m.category,
+                    m.end_date,
+                    m.last_checked
+                {_UNRESOLVED_MARKETS_FROM}
+                ORDER BY m.last_checked ASC
+                LIMIT ?
+            """, (-1 if limit is None else limit,))
+            for row in cursor:
+                yield dict(row)
+        finally:
+            conn.close()
 
-        return markets
+    def count_unresolved_markets(self) -> int:
+        """Number of markets get_unresolved_markets() would return."""
+        conn = self.get_connection()
+        try:
+            return conn.execute(
+                f"SELECT COUNT(DISTINCT m.market_id) {_UNRESOLVED_MARKETS_FROM}"
+            ).fetchone()[0]
+        finally:
+            conn.close()
 
     def get_trades_for_market(self, market_id: str) -> List[Dict]:
         """Get all trades for a specific market."""
@@ -712,6 +816,42 @@ class Database:
             }
         return None
 
+    def get_trader_stats_bulk(self, addresses: List[str]) -> Dict[str, Dict]:
+        """
+        get_trader_stats() for many addresses, keyed by address, in one query
+        per 500 addresses (kept under SQLite's bound-parameter limit).
+        Addresses with no traders row are absent from the result.
+        """
+        stats = {}
+        if not addresses:
+            return stats
+        addresses = list(addresses)
+        conn = self.get_connection()
+        try:
+            for i in range(0, len(addresses), 500):
+                chunk = addresses[i:i + 500]
+                ph = ','.join('?' * len(chunk))
+                cursor = conn.execute(f"""
+                    SELECT address, total_trades, successful_trades, win_rate,
+                           total_volume, is_flagged
+                    FROM traders
+                    WHERE address IN ({ph})
+                """, chunk)
+                stats.update(
+                    (row[0], {
+                        'address': row[0],
+                        'total_trades': row[1],
+                        'successful_trades': row[2],
+                        'win_rate': row[3],
+                        'total_volume': row[4],
+                        'is_flagged': bool(row[5])
+                    })
+                    for row in cursor
+                )
+        finally:
+            conn.close()
+        return stats
+
     def get_all_flagged_traders_stats(self) -> List[Dict]:
         """Get statistics for all flagged traders."""
         conn = self.get_connection()
@@ -871,6 +1011,16 @@ class Database:
 
         print(f"[DATABASE] Stored new market: {market_id[:10]}... - {title[:50]}")
 
+    def get_columns(self, table: str) -> frozenset:
+        """Column names of `table`, for schema checks (empty if it doesn't exist)."""
+        conn = self.get_connection()
+        try:
+            # Table-valued pragma: the name is bound, not formatted in
+            cursor = conn.execute("SELECT name FROM pragma_table_info(?)", (table,))
+            return frozenset(row[0] for row in cursor)
+        finally:
+            conn.close()
+
     def migrate_add_api_id_column(self):
         """
         Add api_id column to store numeric market IDs for Gamma API.
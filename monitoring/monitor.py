@@ -1,12 +1,14 @@
 import asyncio
+import concurrent.futures
 import logging
 import re
 import time
 from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime
 from typing import Optional, Dict
 from .database import Database
-from .polymarket_client import PolymarketClient
+from .polymarket_client import PolymarketClient, json_loads
 from .trader_analyzer import TraderAnalyzer
 from .position_tracker import PositionTracker
 from .background_pnl_worker import BackgroundPnLWorker
@@ -14,6 +16,19 @@ from .background_backfill_worker import BackgroundBackfillWorker
 
 # Telegram imports removed - all notifications handled by System Observer
 
+# ciso8601 is a C ISO-8601 parser that accepts a trailing 'Z' directly; the
+# stdlib fallback only accepts 'Z' from Python 3.11, so rewrite it there.
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    def _parse_iso_datetime(value: str) -> datetime:
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+
+# Concurrent CLOB end_date lookups per cycle (rate-limited by the client's bucket)
+_CLOB_BACKFILL_WORKERS = 8
+
 _monitor_logger = logging.getLogger('monitor')
 
 # AI Filtering Configuration
@@ -40,6 +55,318 @@ GAMMA_CATEGORY_MAP: dict = {
     'Politics':           'Geopolitics',
 }
 
+# Keyword exclusion list for _keyword_exclusion_check — comprehensive list for
+# non-geopolitics markets.  Built once at import; matched as lowercase substrings.
+EXCLUSION_KEYWORDS: tuple = (
+    # CRYPTO - Major cryptocurrencies
+    'bitcoin', 'btc', 'ethereum', 'eth', 'crypto', 'xrp', 'ripple',
+    'solana', 'sol', 'dogecoin', 'doge', 'cardano', 'ada',
+    'price above', 'price below', 'up or down', 'dip to $',
+
+    # CRYPTO AIRDROPS & TOKEN LAUNCHES
+    'fdv above', 'fdv >', 'fdv>', 'market cap >', 'market cap>',
+    'one day after launch', 'day after launch', '1 day after launch',
+    'airdrop', 'token launch', 'token airdrop',
+
+    # GOLD PRICE PREDICTIONS
+    'gold close between', 'gold price', 'gold hits', 'gold hit', 'gold reaches',
+    'gold above', 'gold below', 'gold closes', 'price of gold',
+
+    # STOCKS - Major tickers and patterns
+    'nvda', 'nvidia', 'tsla', 'tesla', 'aapl', 'apple',
+    'msft', 'microsoft', 'googl', 'google', 'amzn', 'amazon',
+    'meta', 'pltr', 'palantir', 'zm', 'zoom',
+    'close at $', 'close above $', 'close below $',
+    'finish week', 'quarterly earnings', 'beat earnings',
+
+    # SPORTS BETTING - Critical patterns
+    'spread:', 'o/u ', 'over/under', 'moneyline',
+    '(-', '(+',  # Point spreads like "Bills (-5.5)"
+    'touchdown', 'anytime touchdown', 'first touchdown',
+
+    # SPORTS LEAGUES & CHAMPIONSHIPS
+    'nfl', 'nba', 'mlb', 'nhl', 'mls',
+    'premier league', 'champions league',
+    'serie a', 'bundesliga', 'ligue 1', 'la liga',
+    'super bowl', 'world series', 'stanley cup',
+    'win the championship', 'make the playoffs',
+    'australian open', 'wimbledon', 'french open', 'us open',
+    'wta', 'tennis championship', 'tennis open',
+    'merida open', 'rio open', 'open akron',
+    'atp 250', 'atp 500', 'wta 250',
+    'ufc', 'mma', 'nascar', 'pga tour',
+    'formula 1', 'formula one', 'f1 ',
+    'grand prix', 'grand slam',
+
+    # SOCCER/FOOTBALL - Major teams
+    'barcelona', 'manchester', 'real madrid', 'bayern',
+    'liverpool', 'chelsea', 'arsenal', 'psg',
+    'win on 2025', 'win on 202',  # Match date patterns
+
+    # BRAZILIAN FOOTBALL
+    'cruzeiro', 'flamengo', 'palmeiras', 'corinthians',
+
+    # COLLEGE SPORTS
+    'ohio state', 'georgia tech', 'alabama', 'michigan',
+
+    # TRADITIONAL SPORTS - Teams and keywords
+    'championship', 'playoff', 'vs.', 'game', 'match',
+    'warriors', 'thunder', 'lakers', 'celtics', 'cowboys',
+    'patriots', 'bills', 'chiefs', 'bengals',
+    'maple leafs', 'bruins', 'atp', 
+
+    # ENTERTAINMENT - AWARDS & NOMINATIONS
+    'academy award', 'oscar', 'oscars', 'grammy', 'grammys',
+    'emmy', 'emmys', 'tony awards', 'golden globe', 'bafta',
+    'cannes', 'sundance',
+    'nominated for best', 'win best actor', 'win best actress',
+    'win best director', 'win best picture', 'win best film',
+    'best supporting actor', 'best supporting actress',
+    'best documentary', 'best animated', 'best song',
+    'best film editing', 'costume', 'editing', 'gross', 'grossing',
+    'season', 'performance',
+
+    # ENTERTAINMENT - MUSIC
+    'songwriter of the year', 'album of the year', 'record of the year',
+    'most streamed', 'streamed on spotify', 'spotify',
+
+    # ENTERTAINMENT - MEDIA & STREAMING
+    'movie', 'film', 'documentary', 'box office', 'opening weekend',
+    'streamer of the year', 'twitch', 'kai cenat',
+
+    # ENTERTAINMENT - BEAUTY PAGEANTS
+    'miss universe', 'miss world', 'beauty pageant',
+    'venezuela', 'thailand', 'canada',  # Common Miss Universe countries
+
+    # ENTERTAINMENT - MISC
+    'album', 'taylor swift',
+
+    # WEATHER
+    'temperature', 'highest temperature', 'weather',
+
+    # APP RANKINGS
+    '#1 free app', 'app store', 'chatgpt', 'threads',
+    'apple app store', 'google play',
+
+    # ATHLETE SEARCHES
+    '#1 searched athlete', 'most searched', 'google searches',
+    'caitlin clark', 'cristiano ronaldo', 'shohei ohtani',
+    'simone biles', 'lamine yamal',
+
+    # OTHER NON-GEOPOLITICS
+    'elon musk', 'tweet', 'x post',
+    'fed rate', 'interest rate', 'stock market', 'sp500', 's&p',
+
+    # ESPORTS - Direct keywords
+    'esports', 'e-sports', 'gaming tournament',
+
+    # ESPORTS - Tournament keywords (future-proof across all games)
+    'major', 'starladder', 'iem', 'intel extreme masters',
+    'blast', 'esl', 'pgl', 'faceit', 'dreamhack',
+    'worlds', 'masters', 'champions', 'the international',
+    'epic league', 'weplay', 'gamers galaxy', 'rog',
+    'bo3', 'bo5', 'map winner',
+
+    # ESPORTS - Common team names (CS:GO, Valorant, LoL, Dota 2)
+    'g2 esports', 'team vitality', 'fnatic', 'astralis',
+    'natus vincere', "na'vi", 'navi', 'furia',
+    'team falcons', 'ninjas in pyjamas', 'faze clan', 'faze',
+    'cloud9', 'team liquid', 'team spirit', 'heroic',
+    'mousesports', 'mouz', 'complexity', 'parivision',
+    'tyloo', 'eternal fire', 'saw', 'imperial',
+    '9 pandas', 'betboom', 'virtus.pro', 'virtus pro',
+    'ence', 'big', 'godsent', 'og esports',
+    't1 esports', 'gen.g', 'drx', 'jd gaming',
+    'edward gaming', 'royal never give up', 'fpx',
+    'nongshim', 'kt rolster', 'dplus', 'geng', 'kwangdong',
+    'hanwha', 'diplus', 'sandbox gaming',
+
+    # ESPORTS - Game titles
+    'cs:go', 'csgo', 'counter-strike', 'counter strike', 'cs2',
+    'league of legends', 'lol:', 'valorant', 'dota 2', 'dota2', 'dota',
+    'overwatch', 'fortnite', 'rocket league', 'apex legends',
+    'call of duty', 'rainbow six',
+
+    # CRICKET/RUGBY
+    'test match', 'odi', 't20', 'cricket world cup', 'ashes',
+    'ipl', 'big bash', 'county championship',
+    'rugby world cup', 'six nations', 'tri nations', 'super rugby',
+    'rugby championship', 'rugby league',
+
+    # GENERIC MATCH TERMS
+    'match on', 'game on', 'fixture', 'vs on', 'versus on',
+
+    # CLIMATE / WEATHER (137 active markets)
+    'hurricane', 'named storm', 'tropical storm', 'tornado',
+    'earthquake', 'wildfire', 'flood', 'drought',
+    'temperature record', 'celsius', 'fahrenheit',
+    'measles', 'pandemic', 'outbreak', 'epidemic',
+
+    # OIL / COMMODITIES (153 active markets — price bets)
+    'wti crude', 'brent crude', 'crude oil price',
+    'oil price', 'price per barrel', 'barrel',
+    'natural gas price', 'lumber price', 'wheat price',
+    'corn price', 'soybean',
+
+    # EQUITY INDICES / STOCKS
+    'spy ', 'qqq ', 's&p 500', 'nasdaq', 'dow jones',
+    'nifty', 'ftse', 'dax ', 'cac 40',
+    'vix ', 'volatility index',
+    'largest company', 'market cap end',
+
+    # IPO MARKETS
+    'ipo closing', 'ipo market cap', 'ipo by',
+    'spacex ipo', 'kraken ipo', 'stripe ipo',
+    'going public',
+
+    # OLYMPICS / INTERNATIONAL GAMES
+    'olympics', 'olympic games', 'medal count',
+    'gold medal', 'podium finish',
+    'commonwealth games', 'asian games', 'pan american',
+
+    # VIDEO GAMES / GAMING (non-esports)
+    'game launch', 'steam sales', 'launch day sales',
+    'game of the year', 'goty',
+    'copies sold', 'day one sales',
+
+    # SOCIAL MEDIA POST COUNT MARKETS
+    'post 200+', 'post 100+', 'posts from april',
+    'posts from may', 'posts this week',
+    'tweets this week', 'truth social posts',
+
+    # REALITY TV / COMPETITION SHOWS
+    'survivor', 'big brother', 'bachelor', 'bachelorette',
+    'dancing with the stars', 'american idol', 'x factor',
+    'love island', 'drag race',
+
+    # AWARDS NOT ALREADY COVERED
+    'booker prize', 'pulitzer', 'nobel prize',
+    'man booker', 'hugo award',
+
+    # MISCELLANEOUS NICHE
+    'alien', 'ufo', 'bigfoot', 'paranormal',
+    'will aliens', 'extraterrestrial',
+    'lottery', 'powerball', 'mega millions',
+
+    # INFLUENCER / YOUTUBE
+    'mrbeast', 'million subscribers', 'subscribers by',
+
+    # BOXING / COMBAT SPORTS (non-MMA)
+    'go the distance', 'fight to go',
+
+    # SPORTS DIVISION / CONFERENCE AWARDS
+    'pro football draft',
+    'pacific division', 'atlantic division',
+    'metropolitan division', 'central division',
+    'pacific conference', 'atlantic conference',
+)
+
+# All exclusion keywords as one alternation: a single C-level scan of the
+# title instead of ~430 separate substring tests.  Keywords are literals, so
+# any match means "some keyword is a substring" — same verdict as the loop.
+EXCLUSION_KEYWORD_RE = re.compile('|'.join(map(re.escape, EXCLUSION_KEYWORDS)))
+
+# Structural patterns that catch sports regardless of team/player names.
+# Joined into one compiled alternation so a title is classified in a single
+# regex pass instead of ~20 re.search calls (each a re-cache lookup) per title.
+_SPORT_PATTERNS = (
+    r'.+:\s*.+\s+vs\s+.+',        # "City/Tournament: Player vs Player"
+    r'^exact score:',              # Exact score betting
+    r'anytime goalscorer',         # Soccer goalscorer markets
+    r'^map \d+:',                  # Esports map betting
+    r'leading at halftime',        # Soccer halftime markets
+    r'xauusd|xagusd|wti crude',   # Commodity tickers
+    r'nhl.*(trophy|division|conference)',  # NHL awards
+    r'nba.*(trophy|division|conference)', # NBA awards
+    r'\d+\s*-\s*\d+.*\?$',       # Score prediction format
+    # Post count markets (Will X post N-M posts from DATE to DATE?)
+    r'post\s+\d+[-–]\d+\s+posts',
+    r'post\s+\d+\+\s+posts',
+    # Price target markets (Will X hit $N by DATE?)
+    r'hit \(high\)',
+    r'hit \(low\)',
+    r'hit \$[\d,]+',
+    # Goalscorer / player performance
+    r'top .* goal scorer',
+    r'anytime (goal|try|touchdown)',
+    r'first (goal|try|touchdown)',
+    # NFL draft pick markets
+    r'drafted \d+(st|nd|rd|th) overall',
+    # "Will X say Y during Z" trivial speech markets
+    r'will .+ say ".+" during',
+    # Press briefing lateness markets
+    r'be \d+[-–]\d+ minutes late',
+)
+SPORT_PATTERN_RE = re.compile('|'.join(f'(?:{p})' for p in _SPORT_PATTERNS))
+
+# Strong geopolitics signals: a title containing any of these skips the AI
+# layer in _should_exclude_market and is included directly.
+GEOPOLITICS_SIGNALS = (
+    'election', 'president', 'presidential', 'war', 'strike', 'military',
+    'sanctions', 'treaty', 'diplomat', 'congress', 'senate',
+    'prime minister', 'parliament', 'government', 'minister',
+    'ukraine', 'russia', 'china', 'israel', 'gaza', 'iran',
+    'nato', 'un security', 'policy', 'tariff', 'peace deal',
+    'middle east',
+)
+GEOPOLITICS_SIGNAL_RE = re.compile('|'.join(map(re.escape, GEOPOLITICS_SIGNALS)))
+
+# Single-purpose patterns in _keyword_exclusion_check, compiled once at import
+# rather than looked up in re's pattern cache on every call.
+_SPREAD_RE = re.compile(r'spread:.*\(-?\d+\.?\d*\)')
+_OVER_UNDER_RE = re.compile(r'o/u\s+\d+\.?\d*')
+_STOCK_RANGE_RE = re.compile(r'close at \$\d+-\$\d+')
+_GOLD_RANGE_RE = re.compile(r'gold.*\$\d+.*and.*\$\d+')
+_WIN_ON_ISO_DATE_RE = re.compile(r'will \w+ win on 20\d{2}-\d{2}-\d{2}')
+_VAGUE_WIN_RE = re.compile(r'^will [\w\s]+ win(\?)?$')
+_WIN_ON_DATE_RE = re.compile(r'will \w+ win (on )?(20\d{2}[-/]\d{2}[-/]\d{2}|\w+ \d{1,2})')
+
+# Fixed word lists for the secondary heuristics in _keyword_exclusion_check.
+# Module-level so they are built once, not on every title checked.
+
+# "Will X win the <...>?" — indicators the <...> is an esports/gaming tournament:
+_TOURNAMENT_INDICATORS = (
+    # Year patterns (tournaments often have years)
+    '2024', '2025', '2026', '2027',
+    # Generic tournament words that appear in esports but not politics
+    'tournament', 'cup', 'league', 'season',
+)
+# Words that prove the <...> is geopolitics, not a tournament
+_TOURNAMENT_GEO_GUARD = (
+    'election', 'president', 'presidential', 'minister',
+    'parliament', 'vote', 'war', 'treaty', 'senate', 'congress',
+    'referendum', 'campaign', 'primary', 'ceasefire',
+)
+# Typical esports markers in the team name before "win the"
+_ESPORTS_TEAM_MARKERS = ('team ', 'clan', 'gaming', 'esports', 'e-sports')
+
+# Geopolitics context that rescues a short, vague "Will X win?" title
+_VAGUE_WIN_GEO_CONTEXT = (
+    'election', 'president', 'presidential', 'minister',
+    'parliament', 'vote', 'campaign', 'primary', 'referendum',
+)
+
+# Countries/cities that appear frequently in cricket, rugby, soccer betting
+_SPORTS_ENTITIES = (
+    # Cricket/Rugby nations
+    'australia', 'england', 'india', 'pakistan', 'south africa',
+    'new zealand', 'sri lanka', 'west indies', 'bangladesh',
+    # Soccer nations (when in sports context)
+    'brazil', 'argentina', 'france', 'germany', 'spain',
+    'italy', 'portugal', 'netherlands', 'belgium',
+    # US Sports cities
+    'boston', 'new york', 'chicago', 'philadelphia',
+    'dallas', 'houston', 'miami', 'seattle',
+)
+# Geopolitics markers that keep a sports-entity "win" title included
+_SPORTS_GEO_MARKERS = (
+    'election', 'vote', 'president', 'minister',
+    'parliament', 'policy', 'government', 'referendum',
+)
+# One pass per list instead of a per-entity loop with a nested marker scan
+_SPORTS_ENTITY_RE = re.compile('|'.join(map(re.escape, _SPORTS_ENTITIES)))
+_SPORTS_GEO_MARKER_RE = re.compile('|'.join(map(re.escape, _SPORTS_GEO_MARKERS)))
+
 
 def safe_print(message: str, fallback: str = None):
     """
@@ -60,6 +387,21 @@ def safe_print(message: str, fallback: str = None):
         # Silently skip if no fallback or fallback also fails
 
 
+def _parse_trade_timestamp(raw) -> datetime:
+    """
+    Parse a Data API trade timestamp (epoch seconds/ms or ISO-8601 string).
+    Raises on unparseable input.
+    """
+    if isinstance(raw, (int, float)):
+        # Defend against millisecond timestamps (e.g. if
+        # Polymarket Data API ever migrates to ms format)
+        # Values > 1e10 are milliseconds, divide to get seconds
+        return datetime.fromtimestamp(raw / 1000 if raw > 1e10 else raw)
+    if isinstance(raw, str):
+        return _parse_iso_datetime(raw)
+    return _parse_iso_datetime(str(raw))
+
+
 class PolymarketMonitor:
     """Main monitoring service that coordinates all components."""
 
@@ -103,6 +445,9 @@ class PolymarketMonitor:
         self.ai_agent = ai_agent  # Store AI agent
         self.check_interval = check_interval
         self.is_running = False
+        # Set on stop so the inter-cycle waits return immediately instead of
+        # polling is_running once a second.
+        self._stop_event = asyncio.Event()
         self.last_trade_timestamp: Optional[datetime] = None
         saved = self.db.get_monitor_state('last_trade_timestamp')
         if saved:
@@ -122,6 +467,7 @@ class PolymarketMonitor:
         """Request the monitor to stop."""
         safe_print("[STOP] Stop requested via Telegram")
         self.is_running = False
+        self._stop_event.set()
 
     async def _refresh_event_category_map(self) -> None:
         """
@@ -154,7 +500,7 @@ class PolymarketMonitor:
                             timeout=30,
                         ),
                     )
-                    events = resp.json()
+                    events = json_loads(resp.content)
                 except Exception as exc:
                     safe_print(f"[CATEGORY MAP] Fetch error at offset {offset}: {exc}")
                     break
@@ -257,11 +603,17 @@ class PolymarketMonitor:
         if not ids_needing_update:
             return
 
-        updates = {}
-        for condition_id in ids_needing_update:
-            end_date = self.polymarket.get_clob_market_end_date(condition_id)
-            if end_date:
-                updates[condition_id] = end_date
+        # Lookups overlap on a small thread pool; the client's token bucket
+        # keeps the aggregate request rate within the CLOB limit.
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=_CLOB_BACKFILL_WORKERS, thread_name_prefix="clob_backfill"
+        ) as pool:
+            end_dates = pool.map(self.polymarket.get_clob_market_end_date, ids_needing_update)
+            updates = [
+                (end_date, end_date, condition_id)
+                for condition_id, end_date in zip(ids_needing_update, end_dates)
+                if end_date
+            ]
 
         if not updates:
             return
@@ -269,15 +621,14 @@ class PolymarketMonitor:
         conn = self.db.get_connection()
         updated = 0
         try:
-            for condition_id, end_date in updates.items():
-                cur = conn.execute("""
-                    UPDATE markets
-                    SET end_date = ?,
-                        resolution_date = COALESCE(resolution_date, ?)
-                    WHERE market_id = ?
-                      AND end_date IS NULL
-                """, (end_date, end_date, condition_id))
-                updated += cur.rowcount
+            cur = conn.executemany("""
+                UPDATE markets
+                SET end_date = ?,
+                    resolution_date = COALESCE(resolution_date, ?)
+                WHERE market_id = ?
+                  AND end_date IS NULL
+            """, updates)
+            updated = cur.rowcount
             conn.commit()
         except Exception as e:
             safe_print(f"[CLOB] DB update error: {e}")
@@ -369,244 +720,45 @@ class PolymarketMonitor:
 
         Returns True if the market matches exclusion criteria (crypto/sports/entertainment/esports).
         """
-        # Define EXCLUSION keywords - comprehensive list for non-geopolitics markets
-        exclusion_keywords = [
-            # CRYPTO - Major cryptocurrencies
-            'bitcoin', 'btc', 'ethereum', 'eth', 'crypto', 'xrp', 'ripple',
-            'solana', 'sol', 'dogecoin', 'doge', 'cardano', 'ada',
-            'price above', 'price below', 'up or down', 'dip to $',
-
-            # CRYPTO AIRDROPS & TOKEN LAUNCHES
-            'fdv above', 'fdv >', 'fdv>', 'market cap >', 'market cap>',
-            'one day after launch', 'day after launch', '1 day after launch',
-            'airdrop', 'token launch', 'token airdrop',
-
-            # GOLD PRICE PREDICTIONS
-            'gold close between', 'gold price', 'gold hits', 'gold hit', 'gold reaches',
-            'gold above', 'gold below', 'gold closes', 'price of gold',
-
-            # STOCKS - Major tickers and patterns
-            'nvda', 'nvidia', 'tsla', 'tesla', 'aapl', 'apple',
-            'msft', 'microsoft', 'googl', 'google', 'amzn', 'amazon',
-            'meta', 'pltr', 'palantir', 'zm', 'zoom',
-            'close at $', 'close above $', 'close below $',
-            'finish week', 'quarterly earnings', 'beat earnings',
-
-            # SPORTS BETTING - Critical patterns
-            'spread:', 'o/u ', 'over/under', 'moneyline',
-            '(-', '(+',  # Point spreads like "Bills (-5.5)"
-            'touchdown', 'anytime touchdown', 'first touchdown',
-
-            # SPORTS LEAGUES & CHAMPIONSHIPS
-            'nfl', 'nba', 'mlb', 'nhl', 'mls',
-            'premier league', 'champions league',
-            'serie a', 'bundesliga', 'ligue 1', 'la liga',
-            'super bowl', 'world series', 'stanley cup',
-            'win the championship', 'make the playoffs',
-            'australian open', 'wimbledon', 'french open', 'us open',
-            'wta', 'tennis championship', 'tennis open',
-            'merida open', 'rio open', 'open akron',
-            'atp 250', 'atp 500', 'wta 250',
-            'ufc', 'mma', 'nascar', 'pga tour',
-            'formula 1', 'formula one', 'f1 ',
-            'grand prix', 'grand slam',
-
-            # SOCCER/FOOTBALL - Major teams
-            'barcelona', 'manchester', 'real madrid', 'bayern',
-            'liverpool', 'chelsea', 'arsenal', 'psg',
-            'win on 2025', 'win on 202',  # Match date patterns
-
-            # BRAZILIAN FOOTBALL
-            'cruzeiro', 'flamengo', 'palmeiras', 'corinthians',
-
-            # COLLEGE SPORTS
-            'ohio state', 'georgia tech', 'alabama', 'michigan',
-
-            # TRADITIONAL SPORTS - Teams and keywords
-            'championship', 'playoff', 'vs.', 'game', 'match',
-            'warriors', 'thunder', 'lakers', 'celtics', 'cowboys',
-            'patriots', 'bills', 'chiefs', 'bengals',
-            'maple leafs', 'bruins', 'atp', 
-
-            # ENTERTAINMENT - AWARDS & NOMINATIONS
-            'academy award', 'oscar', 'oscars', 'grammy', 'grammys',
-            'emmy', 'emmys', 'tony awards', 'golden globe', 'bafta',
-            'cannes', 'sundance',
-            'nominated for best', 'win best actor', 'win best actress',
-            'win best director', 'win best picture', 'win best film',
-            'best supporting actor', 'best supporting actress',
-            'best documentary', 'best animated', 'best song',
-            'best film editing', 'costume', 'editing', 'gross', 'grossing',
-            'season', 'performance',
-
-            # ENTERTAINMENT - MUSIC
-            'songwriter of the year', 'album of the year', 'record of the year',
-            'most streamed', 'streamed on spotify', 'spotify',
-
-            # ENTERTAINMENT - MEDIA & STREAMING
-            'movie', 'film', 'documentary', 'box office', 'opening weekend',
-            'streamer of the year', 'twitch', 'kai cenat',
-
-            # ENTERTAINMENT - BEAUTY PAGEANTS
-            'miss universe', 'miss world', 'beauty pageant',
-            'venezuela', 'thailand', 'canada',  # Common Miss Universe countries
-
-            # ENTERTAINMENT - MISC
-            'album', 'taylor swift',
-
-            # WEATHER
-            'temperature', 'highest temperature', 'weather',
-
-            # APP RANKINGS
-            '#1 free app', 'app store', 'chatgpt', 'threads',
-            'apple app store', 'google play',
-
-            # ATHLETE SEARCHES
-            '#1 searched athlete', 'most searched', 'google searches',
-            'caitlin clark', 'cristiano ronaldo', 'shohei ohtani',
-            'simone biles', 'lamine yamal',
-
-            # OTHER NON-GEOPOLITICS
-            'elon musk', 'tweet', 'x post',
-            'fed rate', 'interest rate', 'stock market', 'sp500', 's&p',
-
-            # ESPORTS - Direct keywords
-            'esports', 'e-sports', 'gaming tournament',
-
-            # ESPORTS - Tournament keywords (future-proof across all games)
-            'major', 'starladder', 'iem', 'intel extreme masters',
-            'blast', 'esl', 'pgl', 'faceit', 'dreamhack',
-            'worlds', 'masters', 'champions', 'the international',
-            'epic league', 'weplay', 'gamers galaxy', 'rog',
-            'bo3', 'bo5', 'map winner',
-
-            # ESPORTS - Common team names (CS:GO, Valorant, LoL, Dota 2)
-            'g2 esports', 'team vitality', 'fnatic', 'astralis',
-            'natus vincere', "na'vi", 'navi', 'furia',
-            'team falcons', 'ninjas in pyjamas', 'faze clan', 'faze',
-            'cloud9', 'team liquid', 'team spirit', 'heroic',
-            'mousesports', 'mouz', 'complexity', 'parivision',
-            'tyloo', 'eternal fire', 'saw', 'imperial',
-            '9 pandas', 'betboom', 'virtus.pro', 'virtus pro',
-            'ence', 'big', 'godsent', 'og esports',
-            't1 esports', 'gen.g', 'drx', 'jd gaming',
-            'edward gaming', 'royal never give up', 'fpx',
-            'nongshim', 'kt rolster', 'dplus', 'geng', 'kwangdong',
-            'hanwha', 'diplus', 'sandbox gaming',
-
-            # ESPORTS - Game titles
-            'cs:go', 'csgo', 'counter-strike', 'counter strike', 'cs2',
-            'league of legends', 'lol:', 'valorant', 'dota 2', 'dota2', 'dota',
-            'overwatch', 'fortnite', 'rocket league', 'apex legends',
-            'call of duty', 'rainbow six',
-
-            # CRICKET/RUGBY
-            'test match', 'odi', 't20', 'cricket world cup', 'ashes',
-            'ipl', 'big bash', 'county championship',
-            'rugby world cup', 'six nations', 'tri nations', 'super rugby',
-            'rugby championship', 'rugby league',
-
-            # GENERIC MATCH TERMS
-            'match on', 'game on', 'fixture', 'vs on', 'versus on',
-
-            # CLIMATE / WEATHER (137 active markets)
-            'hurricane', 'named storm', 'tropical storm', 'tornado',
-            'earthquake', 'wildfire', 'flood', 'drought',
-            'temperature record', 'celsius', 'fahrenheit',
-            'measles', 'pandemic', 'outbreak', 'epidemic',
-
-            # OIL / COMMODITIES (153 active markets — price bets)
-            'wti crude', 'brent crude', 'crude oil price',
-            'oil price', 'price per barrel', 'barrel',
-            'natural gas price', 'lumber price', 'wheat price',
-            'corn price', 'soybean',
-
-            # EQUITY INDICES / STOCKS
-            'spy ', 'qqq ', 's&p 500', 'nasdaq', 'dow jones',
-            'nifty', 'ftse', 'dax ', 'cac 40',
-            'vix ', 'volatility index',
-            'largest company', 'market cap end',
-
-            # IPO MARKETS
-            'ipo closing', 'ipo market cap', 'ipo by',
-            'spacex ipo', 'kraken ipo', 'stripe ipo',
-            'going public',
-
-            # OLYMPICS / INTERNATIONAL GAMES
-            'olympics', 'olympic games', 'medal count',
-            'gold medal', 'podium finish',
-            'commonwealth games', 'asian games', 'pan american',
-
-            # VIDEO GAMES / GAMING (non-esports)
-            'game launch', 'steam sales', 'launch day sales',
-            'game of the year', 'goty',
-            'copies sold', 'day one sales',
-
-            # SOCIAL MEDIA POST COUNT MARKETS
-            'post 200+', 'post 100+', 'posts from april',
-            'posts from may', 'posts this week',
-            'tweets this week', 'truth social posts',
-
-            # REALITY TV / COMPETITION SHOWS
-            'survivor', 'big brother', 'bachelor', 'bachelorette',
-            'dancing with the stars', 'american idol', 'x factor',
-            'love island', 'drag race',
-
-            # AWARDS NOT ALREADY COVERED
-            'booker prize', 'pulitzer', 'nobel prize',
-            'man booker', 'hugo award',
-
-            # MISCELLANEOUS NICHE
-            'alien', 'ufo', 'bigfoot', 'paranormal',
-            'will aliens', 'extraterrestrial',
-            'lottery', 'powerball', 'mega millions',
-
-            # INFLUENCER / YOUTUBE
-            'mrbeast', 'million subscribers', 'subscribers by',
-
-            # BOXING / COMBAT SPORTS (non-MMA)
-            'go the distance', 'fight to go',
-
-            # SPORTS DIVISION / CONFERENCE AWARDS
-            'pro football draft',
-            'pacific division', 'atlantic division',
-            'metropolitan division', 'central division',
-            'pacific conference', 'atlantic conference',
-        ]
-
         title_lower = market_title.lower()
 
         # Check if any exclusion keyword is in the title
-        for keyword in exclusion_keywords:
-            if keyword in title_lower:
-                # Log which keyword triggered the exclusion (use safe encoding for Windows)
-                safe_print(f"[FILTER] Matched keyword: '{keyword}'", fallback="[FILTER] Keyword matched")
-                return True
+        keyword_match = EXCLUSION_KEYWORD_RE.search(title_lower)
+        if keyword_match:
+            # Log which keyword triggered the exclusion (use safe encoding for Windows)
+            safe_print(f"[FILTER] Matched keyword: '{keyword_match.group(0)}'", fallback="[FILTER] Keyword matched")
+            return True
 
         # REGEX PATTERN DETECTION - Catches patterns that keywords might miss
 
+        # Cheap prefilters: every price-range pattern needs a '$' and every
+        # "will X win ..." pattern needs ' win', so most titles skip those
+        # regexes (and the gold pattern's backtracking) entirely.
+        has_dollar = '$' in title_lower
+        has_win = ' win' in title_lower
+
         # PATTERN: Spread betting (captures any point spread like "(-5.5)")
-        if re.search(r'spread:.*\(-?\d+\.?\d*\)', title_lower):
+        if _SPREAD_RE.search(title_lower):
             safe_print(f"[FILTER] Matched pattern: sports spread betting")
             return True  # EXCLUDE sports spread betting
 
         # PATTERN: Over/Under betting (captures "O/U 61.5")
-        if re.search(r'o/u\s+\d+\.?\d*', title_lower):
+        if _OVER_UNDER_RE.search(title_lower):
             safe_print(f"[FILTER] Matched pattern: over/under betting")
             return True  # EXCLUDE over/under bets
 
         # PATTERN: Stock price ranges "$XXX-$YYY"
-        if re.search(r'close at \$\d+-\$\d+', title_lower):
+        if has_dollar and _STOCK_RANGE_RE.search(title_lower):
             safe_print(f"[FILTER] Matched pattern: stock price range")
             return True  # EXCLUDE stock price predictions
 
         # PATTERN: Gold price ranges "$X-$Y" (e.g., "gold close between $3500 and $3600")
-        if re.search(r'gold.*\$\d+.*and.*\$\d+', title_lower):
+        if has_dollar and _GOLD_RANGE_RE.search(title_lower):
             safe_print(f"[FILTER] Matched pattern: gold price range")
             return True  # EXCLUDE gold price predictions
 
         # PATTERN: "Will [Team] win on [Date]" - Soccer/sports matches
-        if re.search(r'will \w+ win on 20\d{2}-\d{2}-\d{2}', title_lower):
+        if has_win and _WIN_ON_ISO_DATE_RE.search(title_lower):
             safe_print(f"[FILTER] Matched pattern: sports match with date")
             return True  # EXCLUDE soccer/sports matches
 
@@ -628,31 +780,15 @@ class PolymarketMonitor:
             if len(parts) >= 2:
                 tournament_part = parts[1]
 
-                # Indicators this is likely an esports/gaming tournament:
-                tournament_indicators = [
-                    # Year patterns (tournaments often have years)
-                    '2024', '2025', '2026', '2027',
-                    # Generic tournament words that appear in esports but not politics
-                    'tournament', 'cup', 'league', 'season',
-                ]
-
-                # Words that prove this is geopolitics, not a tournament
-                _geo_guard = ['election', 'president', 'presidential', 'minister',
-                              'parliament', 'vote', 'war', 'treaty', 'senate', 'congress',
-                              'referendum', 'campaign', 'primary', 'ceasefire']
-
-                for indicator in tournament_indicators:
-                    if indicator in tournament_part:
-                        if not any(word in tournament_part for word in _geo_guard):
-                            return True
+                # Geo guard depends only on tournament_part: test it once, and
+                # only when some tournament indicator is present.
+                if any(indicator in tournament_part for indicator in _TOURNAMENT_INDICATORS):
+                    if not any(word in tournament_part for word in _TOURNAMENT_GEO_GUARD):
+                        return True
 
                 # Check if the team name (before "win the") contains typical esports markers
                 team_part = parts[0].replace('will ', '')
-                esports_team_markers = [
-                    'team ', 'clan', 'gaming', 'esports', 'e-sports',
-                ]
-
-                for marker in esports_team_markers:
+                for marker in _ESPORTS_TEAM_MARKERS:
                     if marker in team_part:
                         return True
 
@@ -661,75 +797,28 @@ class PolymarketMonitor:
         # These lack the specificity of geopolitics ("Will X win the presidential election?")
         if len(market_title) < 50:
             # Pattern: "Will [name] win?" with no context
-            if re.search(r'^will [\w\s]+ win(\?)?$', title_lower.strip()):
+            if has_win and _VAGUE_WIN_RE.search(title_lower.strip()):
                 # Check if it has geopolitics context
-                geo_context = ['election', 'president', 'presidential', 'minister',
-                               'parliament', 'vote', 'campaign', 'primary', 'referendum']
-
-                if not any(ctx in title_lower for ctx in geo_context):
+                if not any(ctx in title_lower for ctx in _VAGUE_WIN_GEO_CONTEXT):
                     return True  # EXCLUDE vague match without geopolitics context
 
         # ===== SPORTS COUNTRY/TEAM IN NON-GEOPOLITICS CONTEXT =====
         # Countries that appear frequently in cricket, rugby, soccer betting
-        sports_entities = [
-            # Cricket/Rugby nations
-            'australia', 'england', 'india', 'pakistan', 'south africa',
-            'new zealand', 'sri lanka', 'west indies', 'bangladesh',
-            # Soccer nations (when in sports context)
-            'brazil', 'argentina', 'france', 'germany', 'spain',
-            'italy', 'portugal', 'netherlands', 'belgium',
-            # US Sports cities
-            'boston', 'new york', 'chicago', 'philadelphia',
-            'dallas', 'houston', 'miami', 'seattle'
-        ]
-
-        for entity in sports_entities:
-            if entity in title_lower and 'win' in title_lower:
-                # Check for geopolitics markers
-                geo_markers = ['election', 'vote', 'president', 'minister',
-                               'parliament', 'policy', 'government', 'referendum']
-                if not any(marker in title_lower for marker in geo_markers):
-                    return True  # EXCLUDE country without geopolitics context
+        if 'win' in title_lower and _SPORTS_ENTITY_RE.search(title_lower):
+            # Check for geopolitics markers
+            if not _SPORTS_GEO_MARKER_RE.search(title_lower):
+                return True  # EXCLUDE country without geopolitics context
 
         # ===== MATCH WITH DATE PATTERN =====
         # "Will X win on [date]" or "Will X win [month] [day]" = sports match
-        if re.search(r'will \w+ win (on )?(20\d{2}[-/]\d{2}[-/]\d{2}|\w+ \d{1,2})', title_lower):
+        if has_win and _WIN_ON_DATE_RE.search(title_lower):
             # Check if it's NOT an election date
             if 'election' not in title_lower and 'vote' not in title_lower:
                 return True  # EXCLUDE match with specific date
 
         # Structural patterns that catch sports regardless of team/player names
-        sport_patterns = [
-            r'.+:\s*.+\s+vs\s+.+',        # "City/Tournament: Player vs Player"
-            r'^exact score:',              # Exact score betting
-            r'anytime goalscorer',         # Soccer goalscorer markets
-            r'^map \d+:',                  # Esports map betting
-            r'leading at halftime',        # Soccer halftime markets
-            r'xauusd|xagusd|wti crude',   # Commodity tickers
-            r'nhl.*(trophy|division|conference)',  # NHL awards
-            r'nba.*(trophy|division|conference)', # NBA awards
-            r'\d+\s*-\s*\d+.*\?$',       # Score prediction format
-            # Post count markets (Will X post N-M posts from DATE to DATE?)
-            r'post\s+\d+[-–]\d+\s+posts',
-            r'post\s+\d+\+\s+posts',
-            # Price target markets (Will X hit $N by DATE?)
-            r'hit \(high\)',
-            r'hit \(low\)',
-            r'hit \$[\d,]+',
-            # Goalscorer / player performance
-            r'top .* goal scorer',
-            r'anytime (goal|try|touchdown)',
-            r'first (goal|try|touchdown)',
-            # NFL draft pick markets
-            r'drafted \d+(st|nd|rd|th) overall',
-            # "Will X say Y during Z" trivial speech markets
-            r'will .+ say ".+" during',
-            # Press briefing lateness markets
-            r'be \d+[-–]\d+ minutes late',
-        ]
-        for pattern in sport_patterns:
-            if re.search(pattern, title_lower):
-                return True  # EXCLUDE structural sports pattern
+        if SPORT_PATTERN_RE.search(title_lower):
+            return True  # EXCLUDE structural sports pattern
 
         return False
 
@@ -768,16 +857,7 @@ class PolymarketMonitor:
             return True  # EXCLUDE via keywords
 
         # FAST PATH: Strong geopolitics signals skip AI (performance optimization)
-        geopolitics_signals = [
-            'election', 'president', 'presidential', 'war', 'strike', 'military',
-            'sanctions', 'treaty', 'diplomat', 'congress', 'senate',
-            'prime minister', 'parliament', 'government', 'minister',
-            'ukraine', 'russia', 'china', 'israel', 'gaza', 'iran',
-            'nato', 'un security', 'policy', 'tariff', 'peace deal',
-            'middle east',
-        ]
-
-        if any(signal in market_title.lower() for signal in geopolitics_signals):
+        if GEOPOLITICS_SIGNAL_RE.search(market_title.lower()):
             safe_print(f"[FAST PATH] Strong geopolitics signal: {market_title[:50]}...", "[FAST PATH] Strong geopolitics signal")
             return False  # INCLUDE without AI check
 
@@ -807,63 +887,83 @@ class PolymarketMonitor:
 
     async def check_for_new_trades(self):
         """Check for new trades from flagged traders."""
-        flagged_traders = self.db.get_flagged_traders()
+        flagged_set = await asyncio.to_thread(self.db.get_flagged_trader_set)
 
-        if not flagged_traders:
+        if not flagged_set:
             safe_print("No flagged traders to monitor yet.")
             return 0
 
-        safe_print(f"Monitoring {len(flagged_traders)} flagged traders...")
+        safe_print(f"Monitoring {len(flagged_set)} flagged traders...")
 
         # Strategy: Fetch all recent trades and filter for our flagged traders
         # This is more efficient than calling get_trader_history() for each trader
         safe_print("Fetching recent trades from Polymarket...")
-        all_recent_trades = self.polymarket.get_market_trades(
-            market_id=None, limit=500, after_timestamp=self.last_trade_timestamp
+        # Blocking HTTP (up to 30s timeout) — run in the thread pool so the
+        # event loop keeps servicing other tasks while the poll is in flight.
+        all_recent_trades = await asyncio.to_thread(
+            self.polymarket.get_market_trades,
+            market_id=None, limit=500, after_timestamp=self.last_trade_timestamp,
         )
 
         safe_print(f"[OK] Fetched {len(all_recent_trades)} recent trades")
         _monitor_logger.info(f"Fetched {len(all_recent_trades)} recent trades")
 
-        # Compute max timestamp across ALL fetched trades so the cursor advances
-        # even when no flagged traders appear in this batch.
+        # Single pass over the batch: compute max timestamp across ALL fetched
+        # trades (so the cursor advances even when no flagged traders appear)
+        # and pick out the trades from our flagged traders.
+        # Each timestamp is parsed here once and carried with the trade.
         batch_max_ts: Optional[datetime] = None
+        relevant_trades = []
         for _t in all_recent_trades:
-            _ts_raw = _t.get('timestamp')
             try:
-                if isinstance(_ts_raw, (int, float)):
-                    _ts = _ts_raw / 1000 if _ts_raw > 1e10 else _ts_raw
-                    _ts_dt = datetime.fromtimestamp(_ts)
-                else:
-                    _ts_dt = datetime.fromisoformat(str(_ts_raw).replace('Z', '+00:00'))
+                _ts_dt = _parse_trade_timestamp(_t.get('timestamp'))
                 if batch_max_ts is None or _ts_dt > batch_max_ts:
                     batch_max_ts = _ts_dt
             except Exception:
-                pass
+                _ts_dt = None
 
-        # Convert flagged traders to a set for fast lookup
-        flagged_set = set(flagged_traders)
+            wallet = _t.get('proxyWallet')
+            if wallet in flagged_set:
+                relevant_trades.append((wallet, _t, _ts_dt))
 
-        # Filter for trades from our flagged traders
-        relevant_trades = []
-        for trade in all_recent_trades:
-            trader = trade.get('proxyWallet')
-            if trader in flagged_set:
-                relevant_trades.append((trader, trade))
+        # Only the flagged traders' rows are needed from here on; drop the raw
+        # batch so it isn't held across the per-trade DB awaits below.
+        del all_recent_trades
 
         safe_print(f"Found {len(relevant_trades)} trades from flagged traders")
 
+        # Most polled trades were stored on an earlier cycle. Look their ids up
+        # in one query so duplicates skip classification and parsing below.
+        candidate_ids = [
+            trade.get('transactionHash') or trade.get('id') for _, trade, _ in relevant_trades
+        ]
+        existing_ids = await asyncio.to_thread(
+            self.db.get_existing_trade_ids, [tid for tid in candidate_ids if tid]
+        )
+
         new_trades_count = 0
         duplicate_count = 0
         excluded_count = 0
         clob_pending: set = set()
+        # A batch holds many trades per market; classify each distinct
+        # (title, category) once instead of re-running the filter per trade.
+        exclusion_by_market: Dict[tuple, bool] = {}
 
-        for trader_address, trade in relevant_trades:
+        for trader_address, trade, parsed_timestamp in relevant_trades:
             # Extract trade information
             trade_id = trade.get('transactionHash') or trade.get('id')
             if not trade_id:
                 safe_print(f"[WARNING] Trade missing ID, skipping...")
                 continue
+            if trade_id in existing_ids:
+                # Still queue the market: a CLOB end_date lookup that failed
+                # earlier is retried on the next poll (the backfill only
+                # touches stored markets with end_date IS NULL)
+                market_id = trade.get('conditionId') or trade.get('market')
+                if market_id:
+                    clob_pending.add(market_id)
+                duplicate_count += 1
+                continue
 
             market_id = trade.get('conditionId') or trade.get('market')
             outcome = trade.get('outcome', 'Unknown')
@@ -871,7 +971,6 @@ class PolymarketMonitor:
             price = float(trade.get('price', 0))
             side = trade.get('side', 'unknown')
             transaction_hash = trade.get('transactionHash', '') or None
-            timestamp_raw = trade.get('timestamp')
             market_title = trade.get('title', 'Unknown Market')
             # Look up Gamma event category for this market's conditionId
             event_category = self._event_category_map.get(market_id) if market_id else None
@@ -880,25 +979,20 @@ class PolymarketMonitor:
             )
 
             # CHECK: Skip trades from excluded markets (crypto/sports/entertainment)
-            if await self._should_exclude_market(market_title, event_category):
+            market_key = (market_title, event_category)
+            is_excluded = exclusion_by_market.get(market_key)
+            if is_excluded is None:
+                is_excluded = await self._should_exclude_market(market_title, event_category)
+                exclusion_by_market[market_key] = is_excluded
+            if is_excluded:
                 excluded_count += 1
                 continue
 
             if market_id:
                 clob_pending.add(market_id)
 
-            # Parse timestamp
-            try:
-                if isinstance(timestamp_raw, (int, float)):
-                    # Defend against millisecond timestamps (e.g. if
-                    # Polymarket Data API ever migrates to ms format)
-                    # Values > 1e10 are milliseconds, divide to get seconds
-                    ts = timestamp_raw / 1000 if timestamp_raw > 1e10 else timestamp_raw
-                    timestamp = datetime.fromtimestamp(ts)
-                else:
-                    timestamp = datetime.fromisoformat(str(timestamp_raw).replace('Z', '+00:00'))
-            except:
-                timestamp = datetime.now()
+            # Timestamp was parsed in the batch pass; unparseable -> now
+            timestamp = parsed_timestamp or datetime.now()
 
             # Client-side cursor filter — definitive safety net against duplicates
             # regardless of whether the API honoured the after_timestamp param.
@@ -1008,22 +1102,19 @@ class PolymarketMonitor:
                 trades_by_trader[trader] = []
             trades_by_trader[trader].append(trade)
 
-        # Get trader stats for all traders
-        trader_stats_map = {}
-        for trader in trades_by_trader.keys():
-            # FIX-2 2026-05-25: moved to thread pool to unblock event loop
-            stats = await asyncio.to_thread(self.db.get_trader_stats, trader)
-            if stats:
-                trader_stats_map[trader] = stats
+        # Get trader stats for all traders (one IN (...) query, not one per trader)
+        trader_stats_map = await asyncio.to_thread(
+            self.db.get_trader_stats_bulk, list(trades_by_trader)
+        )
 
         safe_print(f"Bundled into {len(trades_by_trader)} traders")
 
         # Telegram notifications disabled - Observer handles all notifications
 
-        # Mark all as notified
-        for trade in unnotified_trades:
-            # FIX-2 2026-05-25: moved to thread pool to unblock event loop
-            await asyncio.to_thread(self.db.mark_trade_notified, trade['trade_id'])
+        # Mark all as notified (single executemany transaction)
+        await asyncio.to_thread(
+            self.db.mark_trades_notified, [trade['trade_id'] for trade in unnotified_trades]
+        )
 
     def _update_activity_timestamp(self):
         """
@@ -1315,13 +1406,17 @@ class PolymarketMonitor:
                 # Telegram notifications disabled - Observer monitors logs and sends alerts
 
             # Wait for next cycle or until stop is requested
-            for _ in range(self.check_interval):
-                if not self.is_running:
-                    break
-                await asyncio.sleep(1)
+            await self._wait_for_stop(self.check_interval)
 
         safe_print("\n[STOP] Monitoring loop stopped")
 
+    async def _wait_for_stop(self, timeout: float) -> None:
+        """Sleep up to `timeout` seconds, returning early if stop is requested."""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
     async def _watchdog_loop(self):
         """
         Heartbeat loop that writes to the log every 5 minutes unconditionally.
@@ -1338,7 +1433,7 @@ class PolymarketMonitor:
 
         while self.is_running:
             try:
-                await asyncio.sleep(300)  # 5 minutes
+                await self._wait_for_stop(300)  # 5 minutes
                 if self.is_running:
                     msg = f"[WATCHDOG] Heartbeat — monitor alive at {datetime.now().strftime('%H:%M:%S')}"
                     safe_print(msg)
@@ -1363,6 +1458,7 @@ class PolymarketMonitor:
         safe_print("="*70 + "\n")
 
         self.is_running = True
+        self._stop_event.clear()
 
         # Skip initial scan if traders are already flagged — the periodic re-scan
         # every 10 cycles handles ongoing discovery. Initial scan only needed on
@@ -1419,6 +1515,7 @@ class PolymarketMonitor:
         """
         safe_print("\n[STOP] Stopping Polymarket Monitor...")
         self.is_running = False
+        self._stop_event.set()
 
         # NEW: Stop background P&L worker
         if hasattr(self, 'pnl_worker'):
@@ -1433,6 +1530,12 @@ class PolymarketMonitor:
         safe_print("[OK] Monitor stopped successfully\n")
 
 
+# _keyword_exclusion_check has no instance-state dependencies, so one bare
+# instance (object.__new__, __init__ skipped) serves every should_include_market call.
+_KEYWORD_FILTER = object.__new__(PolymarketMonitor)
+
+
+@lru_cache(maxsize=8192)
 def should_include_market(title: str, event_category: Optional[str] = None) -> bool:
     """
     Module-level synchronous filter: category gate + keyword check (no AI).
@@ -1442,7 +1545,10 @@ def should_include_market(title: str, event_category: Optional[str] = None) -> b
 
     Gate 0: HARD_EXCLUDE / HARD_INCLUDE category sets.
     Gate 1: Full keyword + regex check via PolymarketMonitor._keyword_exclusion_check.
-            The method has no instance-state dependencies; object.__new__ is safe here.
+
+    The verdict is a pure function of (title, event_category), so results are
+    memoised: callers re-filter the same slowly-changing market set every tick.
+    Keyword-match log lines are printed on the first evaluation only.
     """
     if event_category:
         cat = event_category.strip()
@@ -1450,8 +1556,7 @@ def should_include_market(title: str, event_category: Optional[str] = None) -> b
             return False
         if cat in HARD_INCLUDE_CATEGORIES:
             return True
-    _stub = object.__new__(PolymarketMonitor)
-    return not _stub._keyword_exclusion_check(title)
+    return not _KEYWORD_FILTER._keyword_exclusion_check(title)
 
 
 async def main(polymarket_api_key: str, telegram_token: str,
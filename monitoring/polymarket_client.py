@@ -1,8 +1,193 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from itertools import islice
 from typing import List, Dict, Optional
 from datetime import datetime
+import threading
 import time
 import json
+import logging
+import re
+
+_logger = logging.getLogger(__name__)
+
+# orjson decodes the large /trades and /markets payloads several times faster
+# than the stdlib; fall back transparently when it isn't installed.
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`, so short
+    bursts run at network speed while the long-run request rate stays capped.
+    acquire() blocks the calling thread until a token is available.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire `ttl` seconds after being set.
+
+    get() returns None on a miss or an expired entry, so callers should only
+    set() values they would not otherwise get back as None.
+    """
+
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # key -> (expires_at monotonic, value)
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+# Session connection pool: enough keep-alive sockets per host for the thread
+# pools that share one client (trader analysis, CLOB backfill).  Rate-limit
+# (429, honouring Retry-After), server errors and dropped connections are
+# retried with backoff; the final response is still returned so callers'
+# status_code checks stay in charge.  (requests already sends
+# Accept-Encoding: gzip, deflate, so large JSON bodies arrive compressed.)
+_POOL_CONNECTIONS = 8
+_POOL_MAXSIZE = 32
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    raise_on_status=False,
+)
+
+# get_market_details() cache: successful lookups are reused for this long, so
+# repeated lookups of the same market within a scan cycle skip the round trip.
+_DETAILS_TTL_SECONDS = 60.0
+_DETAILS_CACHE_MAX = 4096
+
+# get_markets() results per (category, limit): analysis tools re-request the
+# same listing many times per session.
+_MARKETS_TTL_SECONDS = 60.0
+_MARKETS_CACHE_MAX = 64
+
+# get_trader_history() results: short-lived, just enough for back-to-back
+# analyses of the same address not to re-download up to 500 trades.
+_HISTORY_TTL_SECONDS = 15.0
+_HISTORY_CACHE_MAX = 1024
+
+# Gamma tag slugs used as a server-side pre-filter in get_markets().  Only
+# categories with a known matching tag are listed; others are fetched untagged.
+GAMMA_TAG_SLUGS = {
+    "geopolitics": "geopolitics",
+    "elections": "elections",
+}
+
+# CLOB /markets lookups: 10 req/s sustained, shared by every client instance
+# (the limit is per-IP, and _backfill_clob_end_dates calls from a thread pool).
+_CLOB_BUCKET = TokenBucket(rate=10, capacity=10)
+
+# Data API /trades lookups: analyze_and_flag_traders fans per-trader history
+# calls out over a thread pool, so cap the aggregate rate the same way.
+_DATA_API_BUCKET = TokenBucket(rate=10, capacity=10)
+
+# Gamma /markets: Polymarket allows 1500 requests per 10s window, so the
+# bucket holds a full window's burst and refills at the average rate.
+_GAMMA_BUCKET = TokenBucket(rate=150, capacity=1500)
+
+
+# _filter_by_category keyword lists.  Each category's list is compiled once at
+# import into a single alternation regex (one C-level scan per market instead
+# of a Python `in` per keyword); unknown categories match their own name.
+_KEYWORD_SETS = {
+    # STRICT inclusion keywords for geopolitics
+    'geopolitics': [
+        'election', 'ceasefire', 'war', 'military action', 'invasion',
+        'congress pass', 'senate confirm', 'impeach', 'cabinet',
+        'ambassador', 'nato', 'treaty', 'sanctions',
+        'president of', 'prime minister', 'supreme leader',
+        'ukraine', 'russia', 'gaza', 'iran', 'north korea',
+        'parliament', 'referendum', 'brexit', 'peace deal'
+    ],
+    'politics': [
+        'election', 'president', 'congress', 'senate', 'parliament',
+        'government', 'politics', 'political', 'vote', 'ballot',
+        'campaign', 'candidate', 'governor', 'mayor', 'legislative'
+    ],
+    'crypto': [
+        'bitcoin', 'btc', 'ethereum', 'eth', 'crypto', 'blockchain',
+        'nft', 'defi', 'token', 'coin', 'satoshi', 'mining'
+    ],
+    'sports': [
+        'nfl', 'nba', 'mlb', 'nhl', 'fifa', 'olympics', 'super bowl',
+        'world cup', 'championship', 'playoff', 'finals', 'match',
+        'game', 'team', 'player', 'athlete', 'tournament'
+    ],
+    'finance': [
+        'stock', 'market', 'sp500', 's&p', 'dow', 'nasdaq', 'fed',
+        'interest rate', 'inflation', 'recession', 'gdp', 'unemployment'
+    ]
+}
+
+# Geopolitics EXCLUSION keywords (these override inclusions)
+_GEOPOLITICS_EXCLUSION_KEYWORDS = [
+    'bitcoin', 'btc', 'ethereum', 'eth', 'crypto', 'price above',
+    'price below', '$', 'nfl', 'nba', 'mlb', 'nhl', 'super bowl',
+    'championship', 'playoff', 'team', 'vs.', 'game', 'match',
+    'elon musk', 'tweet', 'x post', 'taylor swift', 'album', 'movie',
+    'fed rate', 'interest rate', 'stock market', 'sp500', 's&p'
+]
+
+
+def _compile_keywords(keywords) -> re.Pattern:
+    """One alternation regex for a keyword list, longest keywords first."""
+    return re.compile('|'.join(sorted(map(re.escape, keywords), key=len, reverse=True)))
+
+
+_KEYWORD_REGEX = {category: _compile_keywords(keywords)
+                  for category, keywords in _KEYWORD_SETS.items()}
+_GEOPOLITICS_EXCLUSION_RE = _compile_keywords(_GEOPOLITICS_EXCLUSION_KEYWORDS)
 
 
 class PolymarketClient:
@@ -14,8 +199,21 @@ class PolymarketClient:
         self.clob_url = "https://clob.polymarket.com"
         self.data_api_url = "https://data-api.polymarket.com"  # Data API works publicly!
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS,
+                              pool_maxsize=_POOL_MAXSIZE, max_retries=_RETRY)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Header-free pooled session for the public Data API and CLOB hosts, so
+        # trade/history/CLOB fan-outs reuse keep-alive connections without
+        # sending the Gamma API key to other hosts.
+        self.public_session = requests.Session()
+        self.public_session.mount("https://", adapter)
         self._clob_end_date_cache: dict = {}
-        self._clob_last_call: float = 0.0
+        self._details_cache = TTLCache(_DETAILS_TTL_SECONDS, _DETAILS_CACHE_MAX)
+        self._markets_cache = TTLCache(_MARKETS_TTL_SECONDS, _MARKETS_CACHE_MAX)
+        self._history_cache = TTLCache(_HISTORY_TTL_SECONDS, _HISTORY_CACHE_MAX)
+        # (url, params) -> (conditional-request headers, parsed market list)
+        self._markets_validators: Dict[tuple, tuple] = {}
 
         # Set up headers with multiple authentication formats
         headers = {
@@ -34,13 +232,34 @@ class PolymarketClient:
 
         self.session.headers.update(headers)
 
+    def _get(self, url: str, bucket: TokenBucket, **kwargs) -> requests.Response:
+        """
+        Session GET gated by an endpoint's token bucket.
+
+        429s are retried by the mounted adapter (_RETRY honours Retry-After),
+        so callers only see the final response.
+        """
+        bucket.acquire()
+        return self.session.get(url, **kwargs)
+
     def get_markets(self, category: str = "Geopolitics", limit: int = 500) -> List[Dict]:
         """
         Fetch markets from Polymarket and filter by category.
 
-        Since Polymarket markets don't have tags or category fields,
-        we use keyword matching on questions, descriptions, and event titles.
+        Categories with a Gamma tag (GAMMA_TAG_SLUGS) are narrowed server-side
+        first; if the tagged request fails or comes back empty, the untagged
+        request is used instead. Either way the keyword filter below runs on
+        the result, since most markets carry no usable tags/category fields —
+        we match keywords in questions, descriptions, and event titles.
+
+        Non-empty results are cached per (category, limit) for
+        _MARKETS_TTL_SECONDS and shared between callers — don't mutate.
         """
+        cache_key = (category.lower(), limit)
+        cached = self._markets_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             url = f"{self.base_url}/markets"
 
@@ -52,52 +271,86 @@ class PolymarketClient:
                 "archived": False  # Exclude archived
             }
 
-            print(f"Fetching markets from: {url}")
-            print(f"Params: {params}")
-
-            response = self.session.get(url, params=params, timeout=30)
-
-            print(f"Response status: {response.status_code}")
-
-            # Don't raise for status yet - let's see what we got
-            if response.status_code != 200:
-                print(f"Error response: {response.text}")
-                print(f"Response headers: {dict(response.headers)}")
+            markets = None
+            tag_slug = GAMMA_TAG_SLUGS.get(category.lower())
+            if tag_slug:
+                markets = self._fetch_markets(url, {**params, "tag_slug": tag_slug})
+                if not markets:
+                    _logger.info("Tag filter '%s' returned nothing; retrying untagged", tag_slug)
+            if not markets:
+                markets = self._fetch_markets(url, params)
+            if markets is None:
                 return []
 
-            # Handle response data
-            data = response.json()
-
-            # Response might be a list or a dict with 'data' key
-            if isinstance(data, dict):
-                if 'data' in data:
-                    markets = data['data']
-                elif 'markets' in data:
-                    markets = data['markets']
-                else:
-                    print(f"Unexpected response format. Keys: {data.keys()}")
-                    return []
-            else:
-                markets = data
-
-            print(f"Total markets fetched: {len(markets)}")
+            _logger.debug("Total markets fetched: %d", len(markets))
 
             # Filter based on category using keyword matching
             filtered_markets = self._filter_by_category(markets, category)
 
-            print(f"Filtered to {len(filtered_markets)} {category} markets")
+            _logger.info("Filtered to %d %s markets", len(filtered_markets), category)
+            if filtered_markets:
+                self._markets_cache.set(cache_key, filtered_markets)
             return filtered_markets
 
         except requests.exceptions.RequestException as e:
-            print(f"Request error fetching markets: {e}")
+            _logger.error("Request error fetching markets: %s", e)
             return []
         except json.JSONDecodeError as e:
-            print(f"JSON decode error: {e}")
+            _logger.error("JSON decode error: %s", e)
             return []
         except Exception as e:
-            print(f"Unexpected error fetching markets: {e}")
+            _logger.error("Unexpected error fetching markets: %s", e)
             return []
 
+    def _fetch_markets(self, url: str, params: Dict) -> Optional[List[Dict]]:
+        """
+        One Gamma /markets request. Returns the market list, or None on error.
+
+        When the previous response for the same params carried an ETag or
+        Last-Modified validator, the request is made conditional; a 304
+        reuses the previously parsed list instead of re-downloading it.
+        """
+        _logger.debug("Fetching markets from %s with %s", url, params)
+
+        key = (url, tuple(sorted(params.items())))
+        previous = self._markets_validators.get(key)
+        headers = previous[0] if previous else None
+
+        response = self._get(url, _GAMMA_BUCKET, params=params, headers=headers, timeout=30)
+
+        _logger.debug("Response status: %s", response.status_code)
+
+        if response.status_code == 304 and previous:
+            return previous[1]
+
+        # Don't raise for status yet - let's see what we got
+        if response.status_code != 200:
+            _logger.error("Error response %s: %s", response.status_code, response.text)
+            _logger.debug("Response headers: %s", response.headers)
+            return None
+
+        # Handle response data
+        data = json_loads(response.content)
+
+        # Response might be a list or a dict with 'data' key
+        if isinstance(data, dict):
+            if 'data' in data:
+                data = data['data']
+            elif 'markets' in data:
+                data = data['markets']
+            else:
+                _logger.error("Unexpected response format. Keys: %s", list(data.keys()))
+                return None
+
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['If-None-Match'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = response.headers['Last-Modified']
+        if validators:
+            self._markets_validators[key] = (validators, data)
+        return data
+
     def _filter_by_category(self, markets: List[Dict], category: str) -> List[Dict]:
         """
         Filter markets by category using keyword matching with exclusions.
@@ -106,50 +359,10 @@ class PolymarketClient:
         in questions, descriptions, and event titles, then exclude noise.
         """
         category_lower = category.lower()
-
-        # Define STRICT inclusion keywords for geopolitics
-        geopolitics_keywords = [
-            'election', 'ceasefire', 'war', 'military action', 'invasion',
-            'congress pass', 'senate confirm', 'impeach', 'cabinet',
-            'ambassador', 'nato', 'treaty', 'sanctions',
-            'president of', 'prime minister', 'supreme leader',
-            'ukraine', 'russia', 'gaza', 'iran', 'north korea',
-            'parliament', 'referendum', 'brexit', 'peace deal'
-        ]
-
-        # Define EXCLUSION keywords (these override inclusions)
-        exclusion_keywords = [
-            'bitcoin', 'btc', 'ethereum', 'eth', 'crypto', 'price above',
-            'price below', '$', 'nfl', 'nba', 'mlb', 'nhl', 'super bowl',
-            'championship', 'playoff', 'team', 'vs.', 'game', 'match',
-            'elon musk', 'tweet', 'x post', 'taylor swift', 'album', 'movie',
-            'fed rate', 'interest rate', 'stock market', 'sp500', 's&p'
-        ]
-
-        keyword_sets = {
-            'geopolitics': geopolitics_keywords,
-            'politics': [
-                'election', 'president', 'congress', 'senate', 'parliament',
-                'government', 'politics', 'political', 'vote', 'ballot',
-                'campaign', 'candidate', 'governor', 'mayor', 'legislative'
-            ],
-            'crypto': [
-                'bitcoin', 'btc', 'ethereum', 'eth', 'crypto', 'blockchain',
-                'nft', 'defi', 'token', 'coin', 'satoshi', 'mining'
-            ],
-            'sports': [
-                'nfl', 'nba', 'mlb', 'nhl', 'fifa', 'olympics', 'super bowl',
-                'world cup', 'championship', 'playoff', 'finals', 'match',
-                'game', 'team', 'player', 'athlete', 'tournament'
-            ],
-            'finance': [
-                'stock', 'market', 'sp500', 's&p', 'dow', 'nasdaq', 'fed',
-                'interest rate', 'inflation', 'recession', 'gdp', 'unemployment'
-            ]
-        }
-
-        # Get keywords for requested category
-        keywords = keyword_sets.get(category_lower, [category_lower])
+        include_re = _KEYWORD_REGEX.get(category_lower)
+        if include_re is None:
+            include_re = re.compile(re.escape(category_lower))
+        exclude_re = _GEOPOLITICS_EXCLUSION_RE if category_lower == 'geopolitics' else None
 
         filtered = []
 
@@ -159,24 +372,20 @@ class PolymarketClient:
             description = str(market.get('description', '')).lower()
 
             # Check events for category keywords
-            events = market.get('events', [])
-            event_text = ''
-            for event in events:
-                event_title = str(event.get('title', '')).lower()
-                event_slug = str(event.get('slug', '')).lower()
-                event_text += f" {event_title} {event_slug}"
+            event_text = ''.join(
+                f" {str(event.get('title', '')).lower()} {str(event.get('slug', '')).lower()}"
+                for event in market.get('events', [])
+            )
 
             # Combine all searchable text
             searchable = f"{question} {description} {event_text}"
 
-            # For geopolitics, apply exclusion filter
-            if category_lower == 'geopolitics':
-                # First check if it should be excluded
-                if any(excl in searchable for excl in exclusion_keywords):
-                    continue
+            # For geopolitics, apply exclusion filter first
+            if exclude_re is not None and exclude_re.search(searchable):
+                continue
 
             # Check if any inclusion keyword matches
-            if any(keyword in searchable for keyword in keywords):
+            if include_re.search(searchable):
                 filtered.append(market)
 
         return filtered
@@ -195,13 +404,13 @@ class PolymarketClient:
                 "archived": False
             }
 
-            response = self.session.get(url, params=params, timeout=30)
+            response = self._get(url, _GAMMA_BUCKET, params=params, timeout=30)
 
             if response.status_code != 200:
-                print(f"Error: {response.status_code} - {response.text}")
+                _logger.error("Error: %s - %s", response.status_code, response.text)
                 return []
 
-            data = response.json()
+            data = json_loads(response.content)
 
             if isinstance(data, dict):
                 markets = data.get('data', data.get('markets', []))
@@ -211,7 +420,7 @@ class PolymarketClient:
             return markets
 
         except Exception as e:
-            print(f"Error fetching all markets: {e}")
+            _logger.error("Error fetching all markets: %s", e)
             return []
 
     def get_market_trades(self, market_id: str, limit: int = 100,
@@ -238,20 +447,22 @@ class PolymarketClient:
             if after_timestamp is not None:
                 params["after"] = after_timestamp.isoformat()
 
+            _DATA_API_BUCKET.acquire()
+
             # Data API is public, no auth needed
-            response = requests.get(url, params=params, timeout=30)
+            response = self.public_session.get(url, params=params, timeout=30)
 
             if response.status_code != 200:
-                print(f"Error fetching trades for {market_id}: {response.status_code}")
+                _logger.warning("Error fetching trades for %s: %s", market_id, response.status_code)
                 return []
 
-            data = response.json()
+            data = json_loads(response.content)
 
             # Data API returns a list of trades
             return data if isinstance(data, list) else []
 
         except Exception as e:
-            print(f"Error fetching trades for market {market_id}: {e}")
+            _logger.warning("Error fetching trades for market %s: %s", market_id, e)
             return []
 
     def get_trader_history(self, trader_address: str, limit: int = 1000) -> List[Dict]:
@@ -259,7 +470,15 @@ class PolymarketClient:
         Fetch trading history for a specific trader using the Data API.
 
         Uses the public Data API which doesn't require authentication.
+        Rate-limited by the shared Data API token bucket, so it is safe to
+        call from a thread pool. Non-empty histories are cached for
+        _HISTORY_TTL_SECONDS and shared between callers — don't mutate.
         """
+        cache_key = (trader_address, limit)
+        cached = self._history_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             url = f"{self.data_api_url}/trades"
             params = {
@@ -267,20 +486,26 @@ class PolymarketClient:
                 "limit": min(limit, 500)  # Data API max is 500
             }
 
+            _DATA_API_BUCKET.acquire()
+
             # Data API is public, no auth needed
-            response = requests.get(url, params=params, timeout=30)
+            response = self.public_session.get(url, params=params, timeout=30)
 
             if response.status_code != 200:
-                print(f"Error fetching trader history for {trader_address}: {response.status_code}")
+                _logger.warning("Error fetching trader history for %s: %s", trader_address, response.status_code)
                 return []
 
-            data = response.json()
+            data = json_loads(response.content)
 
             # Data API returns a list of trades
-            return data if isinstance(data, list) else []
+            if not isinstance(data, list):
+                return []
+            if data:
+                self._history_cache.set(cache_key, data)
+            return data
 
         except Exception as e:
-            print(f"Error fetching trader history for {trader_address}: {e}")
+            _logger.warning("Error fetching trader history for %s: %s", trader_address, e)
             return []
 
     def get_market_details(self, market_id: str) -> Optional[Dict]:
@@ -291,19 +516,26 @@ class PolymarketClient:
             market_id: Market ID (numeric or conditionId)
 
         Returns:
-            Market data dict or None if error
+            Market data dict or None if error. Successful results are cached
+            for _DETAILS_TTL_SECONDS and shared between callers — don't mutate.
         """
+        cached = self._details_cache.get(market_id)
+        if cached is not None:
+            return cached
+
         try:
             url = f"{self.base_url}/markets/{market_id}"
-            response = self.session.get(url, timeout=10)
+            response = self._get(url, _GAMMA_BUCKET, timeout=10)
 
             if response.status_code == 200:
-                return response.json()
+                details = json_loads(response.content)
+                self._details_cache.set(market_id, details)
+                return details
             else:
                 return None
 
         except Exception as e:
-            print(f"Error fetching market {market_id}: {e}")
+            _logger.warning("Error fetching market %s: %s", market_id, e)
             return None
 
     def get_market(self, market_id: str) -> Optional[Dict]:
@@ -342,13 +574,10 @@ class PolymarketClient:
         # 1. Get all markets the trader participated in
         # 2. Check if those markets are resolved
         # 3. Determine if the trader's position won
+        # TODO: Implement actual win rate calculation
+        # This requires checking market resolutions
         successful_trades = 0
 
-        for trade in trades:
-            # TODO: Implement actual win rate calculation
-            # This requires checking market resolutions
-            pass
-
         win_rate = (successful_trades / total_trades * 100) if total_trades > 0 else 0.0
 
         return {
@@ -358,38 +587,34 @@ class PolymarketClient:
             'total_volume': total_volume
         }
 
-    def get_active_traders_from_markets(self, markets: List[Dict]) -> set:
+    def get_active_traders_from_markets(self, markets: List[Dict],
+                                        max_traders: Optional[int] = None) -> set:
         """
         Extract unique trader addresses from recent market activity.
 
         Since Data API works better without market filtering, we fetch all recent
-        trades and filter for our markets locally.
-        """
-        traders = set()
+        trades in a single call. `markets` is kept for the caller's interface;
+        the trades are not filtered by it.
 
-        # Collect market IDs (prefer conditionId for Data API)
-        market_ids = set()
-        for market in markets:
-            condition_id = market.get('conditionId')
-            if condition_id:
-                market_ids.add(condition_id)
-
-        # If no conditionIds, try fetching recent trades without market filter
-        # Data API returns recent trades across all markets
-        print(f"Fetching recent trades to find active traders...")
+        max_traders: if given, keep only the first N distinct traders (most
+        recent trades first), capping the per-trader analysis that follows.
+        """
+        # One unfiltered Data API call returns recent trades across all markets;
+        # a per-market fan-out is not needed to discover active traders.
+        _logger.debug("Fetching recent trades to find active traders...")
         all_trades = self.get_market_trades(market_id=None, limit=500)
 
-        print(f"Found {len(all_trades)} recent trades")
+        _logger.info("Found %d recent trades", len(all_trades))
 
-        for trade in all_trades:
-            # Extract trader addresses from trades
-            # Data API uses 'proxyWallet' field for trader address
-            trader = trade.get('proxyWallet') or trade.get('user') or trade.get('maker')
-
-            if trader:
-                traders.add(trader)
-
-        return traders
+        # Extract trader addresses from trades
+        # Data API uses 'proxyWallet' field for trader address
+        # dict.fromkeys dedupes while keeping API order, so a cap keeps the
+        # most recently active traders.
+        unique_traders = dict.fromkeys(filter(None, (
+            trade.get('proxyWallet') or trade.get('user') or trade.get('maker')
+            for trade in all_trades
+        )))
+        return set(islice(unique_traders, max_traders))
 
     def get_clob_market_end_date(self, condition_id: str) -> Optional[str]:
         """
@@ -397,7 +622,8 @@ class PolymarketClient:
 
         GET https://clob.polymarket.com/markets/{condition_id}
 
-        Results are cached in memory. Rate-limited to 0.1s between calls.
+        Results are cached in memory. Rate-limited by the shared CLOB token
+        bucket (10 req/s), so concurrent callers are safe.
         Returns the end_date_iso string, or None on error/missing field.
         Uses getattr so it is safe when called via __new__ (bypassing __init__).
         """
@@ -409,23 +635,20 @@ class PolymarketClient:
         if condition_id in cache:
             return cache[condition_id]
 
-        last_call = getattr(self, '_clob_last_call', 0.0)
-        elapsed = time.time() - last_call
-        if elapsed < 0.1:
-            time.sleep(0.1 - elapsed)
+        _CLOB_BUCKET.acquire()
 
         clob_url = getattr(self, 'clob_url', 'https://clob.polymarket.com')
+        http = getattr(self, 'public_session', requests)
         try:
-            resp = requests.get(f"{clob_url}/markets/{condition_id}", timeout=10)
-            self._clob_last_call = time.time()
+            resp = http.get(f"{clob_url}/markets/{condition_id}", timeout=10)
             if resp.status_code == 200:
-                data = resp.json()
+                data = json_loads(resp.content)
                 end_date = data.get('end_date_iso') or data.get('endDateIso')
                 if end_date:
                     cache[condition_id] = str(end_date)
                     return str(end_date)
         except Exception as e:
-            print(f"[CLOB] Error fetching end_date for {condition_id[:16]}...: {e}")
+            _logger.warning("[CLOB] Error fetching end_date for %s...: %s", condition_id[:16], e)
 
         return None
 
@@ -438,7 +661,7 @@ class PolymarketClient:
             url = f"{self.base_url}/markets"
             params = {"limit": 1}
 
-            response = self.session.get(url, params=params, timeout=10)
+            response = self._get(url, _GAMMA_BUCKET, params=params, timeout=10)
 
             if response.status_code == 200:
                 print("✅ API connection successful!")
@@ -450,3 +673,18 @@ class PolymarketClient:
         except Exception as e:
             print(f"❌ Connection test failed: {e}")
             return False
+
+
+# Process-wide clients, one per API key, so tools run in the same process
+# share one keep-alive connection pool and warm TTL caches.
+_CLIENTS: Dict[Optional[str], PolymarketClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_client(api_key: str = None) -> PolymarketClient:
+    """Return the shared PolymarketClient for api_key, creating it on first use."""
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(api_key)
+        if client is None:
+            client = _CLIENTS[api_key] = PolymarketClient(api_key)
+        return client
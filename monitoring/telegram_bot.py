@@ -1,5 +1,8 @@
 import asyncio
+import time
+from collections import OrderedDict
 from telegram import Update
+from telegram.error import RetryAfter
 from telegram.ext import (
     Application,
     CommandHandler,
@@ -8,7 +11,42 @@ from telegram.ext import (
     filters
 )
 from typing import Optional, Callable
-from datetime import datetime
+from datetime import datetime, timedelta
+
+# Minimum spacing between messages to the chat. Telegram allows about one
+# message per second per chat; the time a send takes counts toward it.
+_CHAT_SEND_INTERVAL = 1.0
+
+# /status reply; only the timestamp varies per call
+_STATUS_FMT = (
+    "✅ <b>System Status</b>\n\n"
+    "🤖 Bot: Active\n"
+    "📊 Monitoring: Running\n"
+    "🕐 Last check: {last_check}\n"
+)
+
+# Trade alert templates, parsed once at import rather than per alert
+_SINGLE_TRADE_FMT = (
+    "🚨 <b>New Trade Alert!</b>\n\n"
+    "<b>Trader:</b> <code>{trader}...</code>\n"
+    "<b>Volume:</b> ${total_volume:.2f} ({total_trades} trades)\n\n"
+    "<b>Market:</b> {market}\n"
+    "<b>Outcome:</b> {outcome}\n"
+    "<b>Side:</b> {side}\n"
+    "<b>Shares:</b> {shares:.2f}\n"
+    "<b>Price:</b> ${price:.4f}\n"
+    "<b>Time:</b> {timestamp}\n"
+)
+_MULTI_HEADER_FMT = (
+    "🚨 <b>{count} New Trades!</b>\n\n"
+    "<b>Trader:</b> <code>{trader}...</code>\n"
+    "<b>Volume:</b> ${total_volume:.2f} ({total_trades} trades)\n\n"
+)
+_TRADE_ROW_FMT = (
+    "<b>Trade {i}:</b>\n"
+    "  Market: {market}\n"
+    "  {outcome} {side} {shares:.1f} @ ${price:.3f}\n\n"
+)
 
 
 class TelegramNotifier:
@@ -20,9 +58,13 @@ class TelegramNotifier:
         self.application = None
         self.should_stop = False
         self.on_stop_callback: Optional[Callable] = None
-        # Rate limiting: track last notification time per trader
-        self.last_notification = {}  # trader_address -> timestamp
+        # Rate limiting: track last notification time per trader, oldest first
+        # (trader_address -> time.monotonic()); entries past the cooldown are
+        # pruned, so the map only holds recently notified traders.
+        self.last_notification: OrderedDict = OrderedDict()
         self.notification_cooldown = 1800  # 30 minutes in seconds (was 5 min, caused rate limit)
+        # Earliest time.monotonic() the next message may go out (see _wait_send_slot)
+        self._next_send_at = 0.0
 
     async def send_message(self, message: str, max_retries=3):
         """
@@ -30,7 +72,7 @@ class TelegramNotifier:
 
         Args:
             message: Message text to send
-            max_retries: Maximum retry attempts on rate limit (default: 3)
+            max_retries: Maximum retry attempts per part on timeout or rate limit (default: 3)
         """
         if not self.chat_id:
             print("[WARNING] Chat ID not configured. Cannot send message.")
@@ -42,69 +84,100 @@ class TelegramNotifier:
         # Telegram max message length is 4096 characters
         MAX_LENGTH = 4000  # Leave some margin
 
-        # Retry logic with exponential backoff for rate limits
+        if len(message) <= MAX_LENGTH:
+            # Message is short enough, send as-is
+            parts = [message]
+        else:
+            # Split into multiple messages
+            # Lines are collected in a list and joined once per part,
+            # with a running length instead of re-measuring the part.
+            parts = []
+            buf = []
+            size = 0
+
+            for line in message.split('\n'):
+                line_size = len(line) + 1
+                if size + line_size > MAX_LENGTH and buf:
+                    parts.append('\n'.join(buf) + '\n')
+                    buf = []
+                    size = 0
+                buf.append(line)
+                size += line_size
+
+            if buf:
+                parts.append('\n'.join(buf) + '\n')
+
+            if len(parts) > 1:
+                parts = [f"[Part {i}/{len(parts)}]\n\n{part}" for i, part in enumerate(parts, 1)]
+
+        # Send each part; retries are per part, so a failure on a later part
+        # never re-sends the parts that already went out
+        for part in parts:
+            if not await self._send_part(bot, part, max_retries):
+                return
+
+    async def _wait_send_slot(self):
+        """
+        Pace sends to the chat at _CHAT_SEND_INTERVAL.
+
+        Only waits for whatever is left of the interval since the previous
+        send, so an isolated message goes out immediately. The slot is
+        reserved before sleeping, so concurrent callers queue up behind it.
+        """
+        now = time.monotonic()
+        send_at = max(now, self._next_send_at)
+        self._next_send_at = send_at + _CHAT_SEND_INTERVAL
+        if send_at > now:
+            await asyncio.sleep(send_at - now)
+
+    async def _send_part(self, bot, text: str, max_retries: int) -> bool:
+        """
+        Send one message, retrying timeouts and rate limits.
+
+        Telegram's 429 reply carries the wait it requires (RetryAfter); that
+        is honoured instead of guessing with a short backoff, which would just
+        hit the limit again and drop the alert. Returns False if the message
+        was given up on.
+        """
         for attempt in range(max_retries):
+            await self._wait_send_slot()
             try:
-                if len(message) <= MAX_LENGTH:
-                    # Message is short enough, send as-is
-                    await asyncio.wait_for(
-                        bot.send_message(
-                            chat_id=self.chat_id,
-                            text=message,
-                            parse_mode='HTML',
-                            read_timeout=10,
-                            write_timeout=10,
-                            connect_timeout=10,
-                        ),
-                        timeout=15
-                    )
-                else:
-                    # Split into multiple messages
-                    parts = []
-                    current_part = ""
-
-                    for line in message.split('\n'):
-                        if len(current_part) + len(line) + 1 <= MAX_LENGTH:
-                            current_part += line + '\n'
-                        else:
-                            if current_part:
-                                parts.append(current_part)
-                            current_part = line + '\n'
-
-                    if current_part:
-                        parts.append(current_part)
-
-                    # Send each part
-                    for i, part in enumerate(parts, 1):
-                        if len(parts) > 1:
-                            header = f"[Part {i}/{len(parts)}]\n\n"
-                            part = header + part
-
-                        await asyncio.wait_for(
-                            bot.send_message(
-                                chat_id=self.chat_id,
-                                text=part,
-                                parse_mode='HTML',
-                                read_timeout=10,
-                                write_timeout=10,
-                                connect_timeout=10,
-                            ),
-                            timeout=15
-                        )
-                        await asyncio.sleep(0.5)  # Small delay between messages
-
+                await asyncio.wait_for(
+                    bot.send_message(
+                        chat_id=self.chat_id,
+                        text=text,
+                        parse_mode='HTML',
+                        read_timeout=10,
+                        write_timeout=10,
+                        connect_timeout=10,
+                    ),
+                    timeout=15
+                )
                 # Success - exit retry loop
-                return
+                return True
 
             except asyncio.TimeoutError:
                 print(f"[TELEGRAM] Send timeout on attempt {attempt+1}/{max_retries} — skipping")
                 if attempt < max_retries - 1:
                     await asyncio.sleep(2 ** attempt)
                 continue
+            except RetryAfter as e:
+                wait_time = e.retry_after
+                if isinstance(wait_time, timedelta):
+                    wait_time = wait_time.total_seconds()
+                print(f"[RATE LIMIT] Hit Telegram rate limit, attempt {attempt+1}/{max_retries}")
+
+                if attempt < max_retries - 1:
+                    print(f"[WAIT] Telegram asked for {wait_time}s before retry...")
+                    await asyncio.sleep(wait_time)
+                else:
+                    # Max retries reached - give up on this message
+                    print(f"[SKIP] Max retries reached, skipping message to avoid infinite loop")
+                    return False
             except Exception as e:
                 error_msg = str(e)
 
-                # Check if this is a rate limit error (429)
+                # Check if this is a rate limit error (429) without a RetryAfter
                 if "429" in error_msg or "Too Many Requests" in error_msg:
                     print(f"[RATE LIMIT] Hit Telegram rate limit, attempt {attempt+1}/{max_retries}")
 
@@ -116,24 +189,74 @@ class TelegramNotifier:
                     else:
                         # Max retries reached - give up on this message
                         print(f"[SKIP] Max retries reached, skipping message to avoid infinite loop")
-                        return
+                        return False
                 else:
                     # Other error - don't retry
                     print(f"Error sending Telegram message: {e}")
-                    return
+                    return False
+
+        return False
 
     def should_notify_trader(self, trader_address: str) -> bool:
         """Check if enough time has passed since last notification for this trader."""
-        now = datetime.now().timestamp()
-        last_time = self.last_notification.get(trader_address, 0)
+        now = time.monotonic()
+
+        # Drop expired entries from the old end; anything left is in cooldown
+        cutoff = now - self.notification_cooldown
+        while self.last_notification:
+            oldest_address, oldest_time = next(iter(self.last_notification.items()))
+            if oldest_time > cutoff:
+                break
+            del self.last_notification[oldest_address]
+
+        if trader_address in self.last_notification:
+            return False
+        self.last_notification[trader_address] = now
+        return True
+
+    @staticmethod
+    def _format_bundled_alert(trader_address: str, trades: list, trader_stats: dict) -> str:
+        """Build the alert text for one trader's new trades (single or bundled)."""
+        trader = trader_address[:16]
+        total_volume = trader_stats['total_volume']
+        total_trades = trader_stats['total_trades']
+
+        if len(trades) == 1:
+            # Single trade
+            trade = trades[0]
+            return _SINGLE_TRADE_FMT.format(
+                trader=trader, total_volume=total_volume, total_trades=total_trades,
+                market=trade['market_title'][:60], outcome=trade['outcome'],
+                side=trade['side'].upper(), shares=trade['shares'],
+                price=trade['price'], timestamp=trade['timestamp'],
+            )
+
+        # Multiple trades - bundle them (max 5 per message)
+        message = _MULTI_HEADER_FMT.format(
+            count=len(trades), trader=trader,
+            total_volume=total_volume, total_trades=total_trades,
+        ) + ''.join(
+            _TRADE_ROW_FMT.format(
+                i=i, market=trade['market_title'][:50], outcome=trade['outcome'],
+                side=trade['side'].upper(), shares=trade['shares'], price=trade['price'],
+            )
+            for i, trade in enumerate(trades[:5], 1)
+        )
 
-        if now - last_time >= self.notification_cooldown:
-            self.last_notification[trader_address] = now
-            return True
-        return False
+        if len(trades) > 5:
+            message += f"<i>...and {len(trades) - 5} more trades</i>\n"
+
+        return message
 
     async def send_bundled_trade_alerts(self, trades_by_trader: dict, trader_stats_map: dict):
-        """Send bundled trade alerts grouped by trader with rate limiting."""
+        """
+        Send bundled trade alerts grouped by trader with rate limiting.
+
+        All messages are built first, then sent in order. Every alert goes to
+        the same chat, and Telegram allows about one message per second per
+        chat, so sends stay sequential, paced by _wait_send_slot.
+        """
+        messages = []
         for trader_address, trades in trades_by_trader.items():
             # Rate limiting: skip if notified recently
             if not self.should_notify_trader(trader_address):
@@ -144,44 +267,10 @@ class TelegramNotifier:
             if not trader_stats:
                 continue
 
-            # Build bundled message
-            if len(trades) == 1:
-                # Single trade
-                trade = trades[0]
-                message = (
-                    f"🚨 <b>New Trade Alert!</b>\n\n"
-                    f"<b>Trader:</b> <code>{trader_address[:16]}...</code>\n"
-                    f"<b>Volume:</b> ${trader_stats['total_volume']:.2f} "
-                    f"({trader_stats['total_trades']} trades)\n\n"
-                    f"<b>Market:</b> {trade['market_title'][:60]}\n"
-                    f"<b>Outcome:</b> {trade['outcome']}\n"
-                    f"<b>Side:</b> {trade['side'].upper()}\n"
-                    f"<b>Shares:</b> {trade['shares']:.2f}\n"
-                    f"<b>Price:</b> ${trade['price']:.4f}\n"
-                    f"<b>Time:</b> {trade['timestamp']}\n"
-                )
-            else:
-                # Multiple trades - bundle them
-                message = (
-                    f"🚨 <b>{len(trades)} New Trades!</b>\n\n"
-                    f"<b>Trader:</b> <code>{trader_address[:16]}...</code>\n"
-                    f"<b>Volume:</b> ${trader_stats['total_volume']:.2f} "
-                    f"({trader_stats['total_trades']} trades)\n\n"
-                )
-
-                for i, trade in enumerate(trades[:5], 1):  # Max 5 per message
-                    message += (
-                        f"<b>Trade {i}:</b>\n"
-                        f"  Market: {trade['market_title'][:50]}\n"
-                        f"  {trade['outcome']} {trade['side'].upper()} "
-                        f"{trade['shares']:.1f} @ ${trade['price']:.3f}\n\n"
-                    )
-
-                if len(trades) > 5:
-                    message += f"<i>...and {len(trades) - 5} more trades</i>\n"
+            messages.append(self._format_bundled_alert(trader_address, trades, trader_stats))
 
+        for message in messages:
             await self.send_message(message)
-            await asyncio.sleep(1)  # Delay between traders
 
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command."""
@@ -201,12 +290,7 @@ class TelegramNotifier:
 
     async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /status command."""
-        status_msg = (
-            "✅ <b>System Status</b>\n\n"
-            f"🤖 Bot: Active\n"
-            f"📊 Monitoring: Running\n"
-            f"🕐 Last check: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        )
+        status_msg = _STATUS_FMT.format(last_check=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
         await update.message.reply_text(status_msg, parse_mode='HTML')
 
     async def stop_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -272,7 +356,10 @@ class TelegramNotifier:
         if not self.application:
             await self.initialize()
 
+        # Long-poll at Telegram's recommended 25s window: an idle bot then makes
+        # one getUpdates request per 25s instead of one per 10s (the default).
         await self.application.updater.start_polling(
+            timeout=25,
             allowed_updates=Update.ALL_TYPES
         )
 
@@ -1,7 +1,17 @@
-from typing import List, Dict
+import concurrent.futures
+from typing import Dict, Iterable, List
 from .database import Database
 from .polymarket_client import PolymarketClient
 
+# Concurrent Data API lookups per scan.  analyze_trader_performance is one
+# blocking HTTP round-trip per trader, so a small pool overlaps the network
+# wait without hammering the API.
+_ANALYSIS_WORKERS = 8
+
+# Analyzed traders are written in batches of this size, so an error part-way
+# through a scan loses at most one unwritten batch.
+_FLUSH_EVERY = 32
+
 
 class TraderAnalyzer:
     """Analyze traders to identify successful ones worth tracking."""
@@ -13,51 +23,68 @@ class TraderAnalyzer:
         self.min_trades = min_trades
         self.min_volume = min_volume  # Minimum $10k traded
 
-    def analyze_and_flag_traders(self, trader_addresses: List[str]) -> int:
+    def analyze_and_flag_traders(self, trader_addresses: Iterable[str]) -> int:
         """
-        Analyze a list of traders and flag those meeting success criteria.
+        Analyze traders (any iterable of addresses) and flag those meeting
+        success criteria. The input is iterated once.
         Returns the number of newly flagged traders.
         """
         newly_flagged = 0
 
-        for address in trader_addresses:
-            # Check if already flagged
-            existing = self.db.get_trader_stats(address)
-            if existing and existing['is_flagged']:
-                continue
-
-            # Analyze trader performance
-            print(f"Analyzing trader: {address[:10]}...")
-            stats = self.polymarket.analyze_trader_performance(address)
-
-            total_trades = stats['total_trades']
-            total_volume = stats['total_volume']
-            win_rate = stats['win_rate']  # Keep as 0 for now (placeholder)
-
-            # Flag based on volume AND trade count (not win rate)
-            should_flag = (total_trades >= self.min_trades and
-                          total_volume >= self.min_volume)
-
-            self.db.add_or_update_trader(
-                address=address,
-                total_trades=total_trades,
-                successful_trades=stats['successful_trades'],
-                # DISABLED 2026-06-18: win_rate is now owned by
-                # reconcile_trader_aggregates.py (single-writer pattern).
-                # This placeholder 0 was clobbering real values on every
-                # flag/re-flag cycle.  Omitting the argument preserves the
-                # existing DB value (see add_or_update_trader — win_rate
-                # defaults to None, which triggers the preserve-on-conflict
-                # path in the UPSERT).
-                # win_rate=win_rate,
-                total_volume=total_volume,
-                is_flagged=should_flag
-            )
-
-            if should_flag:
-                newly_flagged += 1
-                print(f"[FLAG] Flagged trader {address[:10]}... "
-                      f"(Volume: ${total_volume:.2f}, Trades: {total_trades})")
+        # Skip already-flagged traders before any network work (one query)
+        already_flagged = self.db.get_flagged_trader_set(include_research_excluded=True)
+        pending = [address for address in trader_addresses
+                   if address not in already_flagged]
+
+        if not pending:
+            return 0
+
+        # Analyze trader performance concurrently; results come back in input
+        # order and are written in batches of _FLUSH_EVERY on this thread.
+        trader_rows = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=_ANALYSIS_WORKERS, thread_name_prefix="trader_analyzer"
+        ) as pool:
+            results = pool.map(self.polymarket.analyze_trader_performance, pending)
+
+            for address, stats in zip(pending, results):
+                print(f"Analyzed trader: {address[:10]}...")
+
+                total_trades = stats['total_trades']
+                total_volume = stats['total_volume']
+                win_rate = stats['win_rate']  # Keep as 0 for now (placeholder)
+
+                # Flag based on volume AND trade count (not win rate)
+                should_flag = (total_trades >= self.min_trades and
+                              total_volume >= self.min_volume)
+
+                trader_rows.append((
+                    address,
+                    total_trades,
+                    stats['successful_trades'],
+                    # DISABLED 2026-06-18: win_rate is now owned by
+                    # reconcile_trader_aggregates.py (single-writer pattern).
+                    # This placeholder 0 was clobbering real values on every
+                    # flag/re-flag cycle.  Passing None preserves the
+                    # existing DB value (see add_or_update_trader — win_rate
+                    # None triggers the preserve-on-conflict path in the
+                    # UPSERT).
+                    None,  # win_rate
+                    total_volume,
+                    should_flag,
+                ))
+
+                if should_flag:
+                    newly_flagged += 1
+                    print(f"[FLAG] Flagged trader {address[:10]}... "
+                          f"(Volume: ${total_volume:.2f}, Trades: {total_trades})")
+
+                if len(trader_rows) >= _FLUSH_EVERY:
+                    self.db.add_or_update_traders(trader_rows)
+                    trader_rows = []
+
+        if trader_rows:
+            self.db.add_or_update_traders(trader_rows)
 
         return newly_flagged
 
@@ -69,10 +96,19 @@ class TraderAnalyzer:
         categories = ["Geopolitics", "Global Politics", "Ukraine & Russia",
                       "Elections", "Economics", "Unknown"]
 
+        # The per-category fetches are independent network calls; run them
+        # together. map() keeps category order, so dedup precedence is unchanged.
+        print(f"Fetching markets for {len(categories)} categories...")
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(categories), thread_name_prefix="market_scan"
+        ) as pool:
+            per_category = list(pool.map(
+                lambda category: self.polymarket.get_markets(category=category),
+                categories,
+            ))
+
         seen_ids: dict = {}
-        for category in categories:
-            print(f"Fetching {category} markets...")
-            cat_markets = self.polymarket.get_markets(category=category)
+        for category, cat_markets in zip(categories, per_category):
             print(f"Found {len(cat_markets)} {category} markets")
             for market in cat_markets:
                 condition_id = market.get('conditionId')
@@ -82,20 +118,29 @@ class TraderAnalyzer:
         markets = list(seen_ids.values())
         print(f"Combined {len(markets)} unique markets across all categories")
 
-        # Store market information from the markets we discovered
+        # Store market information in the background while traders are
+        # extracted and analyzed — nothing below reads the stored rows.
         print("Storing market information...")
-        for market in markets:
-            self.db.store_market_dict(market)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="market_store"
+        ) as store_pool:
+            store_done = store_pool.submit(self._store_markets, markets)
+
+            print("Extracting active traders from markets...")
+            traders = self.polymarket.get_active_traders_from_markets(markets)
+            print(f"Found {len(traders)} unique traders")
 
-        print("Extracting active traders from markets...")
-        traders = self.polymarket.get_active_traders_from_markets(markets)
-        print(f"Found {len(traders)} unique traders")
+            print("Analyzing traders for success criteria...")
+            newly_flagged = self.analyze_and_flag_traders(traders)
 
-        print("Analyzing traders for success criteria...")
-        newly_flagged = self.analyze_and_flag_traders(list(traders))
+            store_done.result()
 
         return newly_flagged
 
+    def _store_markets(self, markets: List[Dict]) -> None:
+        for market in markets:
+            self.db.store_market_dict(market)
+
     def get_flagged_traders_summary(self) -> str:
         """Get a formatted summary of all flagged traders."""
         traders = self.db.get_all_flagged_traders_stats()
@@ -103,15 +148,15 @@ class TraderAnalyzer:
         if not traders:
             return "No flagged traders yet."
 
-        summary = f"📊 Currently tracking {len(traders)} successful traders:\n\n"
+        parts = [f"📊 Currently tracking {len(traders)} successful traders:\n\n"]
 
         for i, trader in enumerate(traders, 1):
-            summary += (
+            parts.append(
                 f"{i}. Address: {trader['address'][:10]}...\n"
                 f"   Win Rate: {trader['win_rate']:.1f}% | "
                 f"Trades: {trader['total_trades']} | "
                 f"Volume: ${trader['total_volume']:.2f}\n\n"
             )
 
-        return summary
+        return ''.join(parts)
 
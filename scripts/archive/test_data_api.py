@@ -5,7 +5,7 @@ Quick test to verify trades fetching works with Data API.
 
 import os
 from dotenv import load_dotenv
-from monitoring.polymarket_client import PolymarketClient
+from monitoring.polymarket_client import get_client
 
 load_dotenv()
 
@@ -17,7 +17,7 @@ def test_data_api_trades():
     print("="*70)
 
     api_key = os.getenv("POLYMARKET_API_KEY")
-    client = PolymarketClient(api_key)
+    client = get_client(api_key)
 
     print("\n📊 Test 1: Fetch recent trades (no market filter)")
     print("-"*70)
@@ -4,11 +4,33 @@ Test the updated keyword-based filtering for geopolitics markets.
 """
 
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from monitoring.polymarket_client import PolymarketClient
+from monitoring.polymarket_client import get_client
 
 load_dotenv()
 
+# Keywords reported for the sample markets (Test 1) and counted in the
+# frequency breakdown (Statistics)
+SAMPLE_KEYWORDS = ['war', 'election', 'president', 'government',
+                   'military', 'ukraine', 'russia', 'china', 'politics']
+FREQUENCY_KEYWORDS = SAMPLE_KEYWORDS + ['congress', 'senate', 'iran', 'israel', 'nato']
+
+
+def _keyword_finder(keywords):
+    """
+    One regex that finds every keyword occurrence in a single scan.
+
+    The alternation sits in a lookahead, so matches may overlap — the same
+    substring semantics as testing `kw in text` for each keyword.
+    """
+    return re.compile('(?=(' + '|'.join(map(re.escape, keywords)) + '))')
+
+
+SAMPLE_KEYWORD_RE = _keyword_finder(SAMPLE_KEYWORDS)
+FREQUENCY_KEYWORD_RE = _keyword_finder(FREQUENCY_KEYWORDS)
+
 
 def test_geopolitics_filtering():
     """Test the geopolitics market filtering."""
@@ -21,7 +43,7 @@ def test_geopolitics_filtering():
         print("❌ No POLYMARKET_API_KEY found in .env")
         return
 
-    client = PolymarketClient(api_key)
+    client = get_client(api_key)
 
     print("\n📊 Test 1: Fetch geopolitics markets with default limit (100)")
     print("-"*70)
@@ -38,13 +60,9 @@ def test_geopolitics_filtering():
             print(f"   ID: {market.get('id')}")
 
             # Show which keywords matched
-            q_lower = question.lower()
-            desc_lower = str(market.get('description', '')).lower()
-
-            keywords = ['war', 'election', 'president', 'government',
-                       'military', 'ukraine', 'russia', 'china', 'politics']
-
-            matched = [kw for kw in keywords if kw in q_lower or kw in desc_lower]
+            text = f"{market.get('question') or ''} {market.get('description') or ''}".lower()
+            found = set(SAMPLE_KEYWORD_RE.findall(text))
+            matched = [kw for kw in SAMPLE_KEYWORDS if kw in found]
             if matched:
                 print(f"   Matched keywords: {', '.join(matched[:5])}")
     else:
@@ -69,8 +87,15 @@ def test_geopolitics_filtering():
 
     categories_to_test = ["Politics", "Crypto", "Sports"]
 
-    for cat in categories_to_test:
-        markets = client.get_markets(category=cat, limit=100)
+    # The category fetches are independent; run them concurrently over the
+    # client's pooled session and print in the original order
+    with ThreadPoolExecutor(max_workers=len(categories_to_test)) as pool:
+        category_results = list(pool.map(
+            lambda cat: client.get_markets(category=cat, limit=100),
+            categories_to_test,
+        ))
+
+    for cat, markets in zip(categories_to_test, category_results):
         print(f"\n{cat}: {len(markets)} markets found")
         if markets:
             print(f"  Sample: {markets[0].get('question', 'N/A')[:60]}...")
@@ -91,17 +116,11 @@ def test_geopolitics_filtering():
 
         keyword_counts = Counter()
         for market in geo_markets_large:
-            question = market.get('question', '').lower()
-            desc = market.get('description', '').lower()
-            text = f"{question} {desc}"
-
-            keywords = ['war', 'election', 'president', 'government',
-                       'military', 'ukraine', 'russia', 'china', 'politics',
-                       'congress', 'senate', 'iran', 'israel', 'nato']
-
-            for kw in keywords:
-                if kw in text:
-                    keyword_counts[kw] += 1
+            # Each keyword counts once per market (in list order, so ties in
+            # most_common() keep their original ordering)
+            text = f"{market.get('question') or ''} {market.get('description') or ''}".lower()
+            found = set(FREQUENCY_KEYWORD_RE.findall(text))
+            keyword_counts.update(kw for kw in FREQUENCY_KEYWORDS if kw in found)
 
         if keyword_counts:
             print("\nKeyword frequency in geopolitics markets:")
@@ -5,11 +5,22 @@ Test script to debug Polymarket API connectivity and market fetching.
 
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
-from monitoring.polymarket_client import PolymarketClient
+from monitoring.polymarket_client import PolymarketClient, json_loads
 
-# Load environment variables
+# Load environment variables once; the tests share the key
 load_dotenv()
+API_KEY = os.getenv("POLYMARKET_API_KEY")
+
+# One pooled session for the raw API probes, so only the first request pays
+# the TCP+TLS handshake to gamma-api.  No default auth headers: each probe
+# passes its own.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10,
+                                      max_retries=Retry(total=2, backoff_factor=0.2)))
 
 def test_raw_api_call_no_auth():
     """Test raw API call without authentication."""
@@ -28,11 +39,11 @@ def test_raw_api_call_no_auth():
     print(f"Params: {params}\n")
 
     try:
-        response = requests.get(url, params=params, timeout=30)
+        response = SESSION.get(url, params=params, timeout=30)
         print(f"Status Code: {response.status_code}")
 
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             print(f"✅ Success without auth!")
             print(f"Response type: {type(data)}")
 
@@ -55,7 +66,7 @@ def test_with_api_key():
     print("TEST 2: API Call WITH API Key")
     print("="*70)
 
-    api_key = os.getenv("POLYMARKET_API_KEY")
+    api_key = API_KEY
 
     if not api_key:
         print("⚠️ No POLYMARKET_API_KEY found in .env file")
@@ -81,22 +92,41 @@ def test_with_api_key():
         {"api-key": api_key}
     ]
 
-    for i, headers in enumerate(test_cases, 1):
-        print(f"Try #{i}: Using header {list(headers.keys())[0]}")
+    def probe(headers):
         try:
-            response = requests.get(url, params=params, headers=headers, timeout=30)
+            # stream=True: only the status line and headers are read up
+            # front; the body is downloaded only for the probe we report
+            return SESSION.get(url, params=params, headers=headers,
+                               timeout=30, stream=True), None
+        except Exception as e:
+            return None, e
+
+    # The probes are independent: fire them together, then report in order
+    with ThreadPoolExecutor(max_workers=len(test_cases)) as pool:
+        results = list(pool.map(probe, test_cases))
+
+    try:
+        for i, (headers, (response, error)) in enumerate(zip(test_cases, results), 1):
+            print(f"Try #{i}: Using header {list(headers.keys())[0]}")
+            if error is not None:
+                print(f"  ❌ Error: {error}")
+                continue
+
             print(f"  Status: {response.status_code}")
 
             if response.status_code == 200:
                 print(f"  ✅ Success with this header format!")
-                data = response.json()
+                data = json_loads(response.content)
                 if isinstance(data, list):
                     print(f"  Got {len(data)} markets")
                 return
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
 
-    print("\n")
+        print("\n")
+    finally:
+        # Release every streamed connection back to the pool, read or not
+        for response, _ in results:
+            if response is not None:
+                response.close()
 
 
 def test_polymarket_client():
@@ -105,7 +135,7 @@ def test_polymarket_client():
     print("TEST 3: Updated PolymarketClient")
     print("="*70)
 
-    api_key = os.getenv("POLYMARKET_API_KEY")
+    api_key = API_KEY
 
     if not api_key:
         print("⚠️ Testing without API key (public access)\n")
@@ -138,9 +168,7 @@ def test_polymarket_client():
         print(f"  Tags: {market.get('tags', [])}")
 
         # Show available tags
-        all_tags = set()
-        for m in all_markets[:10]:
-            all_tags.update(m.get('tags', []))
+        all_tags = set().union(*(m.get('tags', ()) for m in all_markets[:10]))
         print(f"\n  Available tags (from first 10 markets): {sorted(all_tags)[:15]}")
 
     print("\n")
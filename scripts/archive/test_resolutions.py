@@ -17,21 +17,16 @@ def test_resolution_tracking():
 
     # Test 1: Check if fields exist
     print("\n[TEST 1] Checking database schema...")
-    import sqlite3
-    conn = sqlite3.connect(db.db_path)
-    cursor = conn.cursor()
-    cursor.execute("PRAGMA table_info(markets)")
-    columns = [col[1] for col in cursor.fetchall()]
-    conn.close()
+    columns = db.get_columns('markets')
 
     required_fields = ['resolved', 'winning_outcome', 'resolution_date']
-    all_present = True
+    missing = set(required_fields) - columns
+    all_present = not missing
     for field in required_fields:
-        if field in columns:
-            print(f"  ✅ Field '{field}' exists")
-        else:
+        if field in missing:
             print(f"  ❌ Field '{field}' MISSING")
-            all_present = False
+        else:
+            print(f"  ✅ Field '{field}' exists")
 
     if all_present:
         print("  ✅ All required fields present!")
@@ -41,12 +36,13 @@ def test_resolution_tracking():
 
     # Test 2: Check unresolved markets
     print("\n[TEST 2] Checking for unresolved markets...")
-    unresolved = db.get_unresolved_markets()
-    print(f"  Found {len(unresolved)} unresolved markets")
+    # Count in SQL and stream only the sample rows we print
+    unresolved_count = db.count_unresolved_markets()
+    print(f"  Found {unresolved_count} unresolved markets")
 
-    if unresolved:
+    if unresolved_count:
         print("  Sample markets:")
-        for market in unresolved[:3]:
+        for market in db.iter_unresolved_markets(limit=3):
             print(f"    - {market['title'][:60]}")
     else:
         print("  (No unresolved markets yet - this is normal for new database)")
@@ -78,7 +74,7 @@ def test_resolution_tracking():
     print("="*70)
     print("\n📊 Summary:")
     print(f"   - Database schema: {'✅ Valid' if all_present else '❌ Invalid'}")
-    print(f"   - Unresolved markets: {len(unresolved)}")
+    print(f"   - Unresolved markets: {unresolved_count}")
     print(f"   - Resolved markets: {len(resolved)}")
     print(f"   - Methods available: ✅")
     print("\n💡 Next steps:")
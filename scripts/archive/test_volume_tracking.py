@@ -4,12 +4,14 @@ Test the complete flow with volume-based trader identification.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from monitoring.polymarket_client import PolymarketClient
 from monitoring.database import Database
 from monitoring.trader_analyzer import TraderAnalyzer
 
 load_dotenv()
+API_KEY = os.getenv("POLYMARKET_API_KEY")
 
 
 def test_volume_based_tracking():
@@ -18,7 +20,7 @@ def test_volume_based_tracking():
     print("TESTING VOLUME-BASED TRADER TRACKING")
     print("="*70)
 
-    api_key = os.getenv("POLYMARKET_API_KEY")
+    api_key = API_KEY
     if not api_key:
         print("❌ No API key found")
         return
@@ -42,19 +44,26 @@ def test_volume_based_tracking():
         print("\n❌ No traders found! Check proxyWallet field extraction.")
         return
 
+    # Materialize the set once, sorted so reruns sample the same addresses
+    trader_list = sorted(traders)
+
     print(f"\nSample trader addresses:")
-    for i, trader in enumerate(list(traders)[:5], 1):
+    for i, trader in enumerate(trader_list[:5], 1):
         print(f"  {i}. {trader}")
 
     print("\n📊 Step 3: Analyze trader performance")
     print("-"*70)
 
     # Test analyzing a few traders
-    sample_traders = list(traders)[:3]
+    sample_traders = trader_list[:3]
+
+    # Each analysis is an independent history fetch: run them concurrently
+    # (the client's token bucket still caps the request rate)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        sample_stats = list(pool.map(client.analyze_trader_performance, sample_traders))
 
-    for trader in sample_traders:
+    for trader, stats in zip(sample_traders, sample_stats):
         print(f"\nTrader: {trader[:16]}...")
-        stats = client.analyze_trader_performance(trader)
 
         print(f"  Total Trades: {stats['total_trades']}")
         print(f"  Total Volume: ${stats['total_volume']:.2f}")
@@ -72,7 +81,7 @@ def test_volume_based_tracking():
     print("\n📊 Step 4: Run full trader analysis")
     print("-"*70)
 
-    newly_flagged = analyzer.analyze_and_flag_traders(list(traders)[:10])
+    newly_flagged = analyzer.analyze_and_flag_traders(trader_list[:10])
 
     print(f"\n✅ Analysis complete!")
     print(f"   Newly flagged: {newly_flagged} traders")
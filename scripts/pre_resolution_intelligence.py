@@ -161,11 +161,11 @@ def _get_market_price(conn: sqlite3.Connection, market: dict) -> float | None:
     # Try live API price if PolymarketClient is importable
     try:
         sys.path.insert(0, _REPO_ROOT)
-        from monitoring.polymarket_client import PolymarketClient
+        from monitoring.polymarket_client import get_client
         from dotenv import load_dotenv
         load_dotenv(os.path.join(_REPO_ROOT, '.env'))
         api_key = os.getenv('POLYMARKET_API_KEY', '')
-        client = PolymarketClient(api_key=api_key)
+        client = get_client(api_key=api_key)
         markets = client.get_markets(limit=1)  # lightweight probe
         # We'd need condition_id lookup for a single market; skip for now
     except Exception:
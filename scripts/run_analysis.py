@@ -5,11 +5,27 @@ Convenience script to run Polymarket analysis tools.
 Provides a menu to select which analysis to run.
 """
 
+import importlib
 import sys
 import os
 
-# Add analysis directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'analysis'))
+# Add the repo-level analysis directory to path (appended, so stdlib and
+# site-packages lookups don't scan it first)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'analysis'))
+
+# Menu choice -> (module, entry point, banner). Modules are imported only
+# when their tool is chosen.
+ANALYSIS_TOOLS = {
+    "1": ("trader_performance_analysis", "main", "Running Trader Performance Analysis..."),
+    "2": ("trading_behavior_analysis", "main", "Running Trading Behavior Analysis..."),
+    "3": ("weighted_consensus_system", "main", "Running Weighted Consensus System..."),
+    "4": ("trader_specialization_analysis", "main", "Running Trader Specialization Analysis..."),
+    "5": ("market_confidence_meter", "main", "Running Market Confidence Meter..."),
+    "6": ("consensus_divergence_detector", "main", "Running Consensus Divergence Detector..."),
+    "7": ("test_analysis_demo", "main", "Running Performance Analysis Demo..."),
+    "8": ("test_behavior_demo", "main", "Running Behavior Analysis Demo..."),
+    "9": ("test_market_filtering", "test_market_exclusion", "Running Market Filtering Test..."),
+}
 
 
 def main():
@@ -57,50 +73,11 @@ def main():
 
     choice = input("Enter choice (1-10): ").strip()
 
-    if choice == "1":
-        print("\nRunning Trader Performance Analysis...")
-        from trader_performance_analysis import main as perf_main
-        perf_main()
-
-    elif choice == "2":
-        print("\nRunning Trading Behavior Analysis...")
-        from trading_behavior_analysis import main as behavior_main
-        behavior_main()
-
-    elif choice == "3":
-        print("\nRunning Weighted Consensus System...")
-        from weighted_consensus_system import main as consensus_main
-        consensus_main()
-
-    elif choice == "4":
-        print("\nRunning Trader Specialization Analysis...")
-        from trader_specialization_analysis import main as spec_main
-        spec_main()
-
-    elif choice == "5":
-        print("\nRunning Market Confidence Meter...")
-        from market_confidence_meter import main as confidence_main
-        confidence_main()
-
-    elif choice == "6":
-        print("\nRunning Consensus Divergence Detector...")
-        from consensus_divergence_detector import main as divergence_main
-        divergence_main()
-
-    elif choice == "7":
-        print("\nRunning Performance Analysis Demo...")
-        from test_analysis_demo import main as demo_main
-        demo_main()
-
-    elif choice == "8":
-        print("\nRunning Behavior Analysis Demo...")
-        from test_behavior_demo import main as behavior_demo_main
-        behavior_demo_main()
-
-    elif choice == "9":
-        print("\nRunning Market Filtering Test...")
-        from test_market_filtering import test_market_exclusion
-        test_market_exclusion()
+    if choice in ANALYSIS_TOOLS:
+        module_name, entry_point, banner = ANALYSIS_TOOLS[choice]
+        print(f"\n{banner}")
+        module = importlib.import_module(module_name)
+        getattr(module, entry_point)()
 
     elif choice == "10":
         print("Goodbye!")
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+tests/test_market_filter_golden.py
+
+Golden-output regression guard for the synchronous market filter in
+monitoring/monitor.py (should_include_market -> _keyword_exclusion_check).
+
+The keyword filter is being reworked for speed (module-level keyword tuple,
+one precompiled alternation regex instead of a Python loop of substring
+tests).  Those changes must not move any market across the include/exclude
+line.  GOLDEN below was captured from the loop-based implementation over
+the titles used by the repo's filtering demo scripts plus hand-picked
+edge cases (spreads, O/U, price ranges, dated matches, esports, vague
+"Will X win?" titles, geopolitics controls).
+
+Tests:
+  T1  every GOLDEN title gets the same include/exclude verdict
+  T2  EXCLUSION_KEYWORD_RE agrees with the plain substring loop over
+      EXCLUSION_KEYWORDS on every GOLDEN title (the exact equivalence the
+      regex rewrite relies on)
+  T3  category gate still overrides the keyword scan in both directions
+  T4  SPORT_PATTERN_RE agrees with per-pattern re.search over
+      _SPORT_PATTERNS on every GOLDEN title plus pattern-specific probes
+  T5  should_include_market is memoised: a repeat call is a cache hit with
+      the same verdict, and the category argument is part of the key
+"""
+
+import contextlib
+import io
+import re
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from monitoring.monitor import (
+    EXCLUSION_KEYWORDS,
+    EXCLUSION_KEYWORD_RE,
+    SPORT_PATTERN_RE,
+    _SPORT_PATTERNS,
+    should_include_market,
+)
+
+
+GOLDEN = [
+    ('#1 free app in the App Store?', False),
+    ('BTC Up or Down - November 14, 6:00PM-6:15PM ET', False),
+    ('Bank of Japan increases interest rates by 25 bps', False),
+    ('Bitcoin Up or Down - November 14, 6:00PM', False),
+    ('Bitcoin Up or Down - November 14, 6:00PM-6:15PM ET', False),
+    ('China x Taiwan military clash by December 31?', True),
+    ('Clippers vs. Mavericks', False),
+    ('Counter-Strike: 9z vs Sharks (BO3)', False),
+    ('Counter-Strike: Passion UA vs paiN (BO3)', False),
+    ('ETH Up or Down on November 15?', False),
+    ('Ethereum Up or Down on November 15?', False),
+    ('Evacuation of Tehran ordered in 2025?', True),
+    ('Exact score: Spain 2-1 Italy?', False),
+    ('Fed decreases interest rates by 25 bps', False),
+    ('Fed decreases interest rates by 50+ bps', False),
+    ('Lakers vs Celtics O/U 221.5', False),
+    ('Lakers vs. Celtics', False),
+    ('Maduro out by November 30, 2025?', True),
+    ('Map 1: Navi vs Faze', False),
+    ('Memphis vs. East Carolina', False),
+    ('Michigan Wolverines vs. TCU Horned Frogs', False),
+    ('Nets vs. Magic', False),
+    ('Penguins vs. Predators', False),
+    ('Russia x Ukraine ceasefire in 2025?', True),
+    ('SOL Up or Down - November 14, 6PM ET', False),
+    ('Solana Up or Down - November 14, 6PM ET', False),
+    ('Spread: Bills (-5.5)', False),
+    ('Spread: Panthers (-1.5)', False),
+    ('Spread: Suns (-4.5)', False),
+    ('Super Bowl LVIII winner', False),
+    ('Thunder vs. Hornets', False),
+    ('Total Sets: O/U 2.5', False),
+    ('US x Venezuela military engagement by December 31?', False),
+    ('Uniswap Cup winner 2025', True),
+    ('Valorant: Bonk vs BLX CORP (BO1)', False),
+    ('Warriors vs. Pelicans', False),
+    ("Will 'The Running Man' Opening Weekend Box Office be above $50M?", False),
+    ('Will Apple (AAPL) finish week of November 10 above $280?', False),
+    ('Will Apple be the largest company in the world?', False),
+    ('Will Armenia win on 2025-11-16?', False),
+    ('Will Arsenal win on 2025-11-02?', False),
+    ('Will Australia win?', False),
+    ('Will BTC dip to $94,000 November 10-16?', False),
+    ('Will Bad Bunny be the top Spotify artist for 2025?', False),
+    ('Will Bayern Munich win the 2025–26 Champions League?', False),
+    ('Will Bitcoin dip to $94,000 November 10-16?', False),
+    ('Will Bitcoin reach $100k by December 2025?', False),
+    ('Will Boston win on Nov 3?', False),
+    ('Will Brazil win the 2026 World Cup?', False),
+    ('Will Canada win on 2025-11-13?', False),
+    ('Will Chelsea beat Arsenal?', False),
+    ('Will Crin Antonescu be the next Mayor of Bucharest?', True),
+    ('Will Călin Georgescu be the next Mayor of Bucharest?', True),
+    ('Will Death Stranding 2 win Game of the Year', False),
+    ('Will ETH dip to $2,600 in November?', False),
+    ('Will Ecuador win on 2025-11-13?', False),
+    ('Will Elon Musk post 200+ tweets this week?', False),
+    ('Will Ethereum dip to $2,600 in November?', False),
+    ('Will Ethereum hit $10,000 by end of year?', False),
+    ('Will Ethereum hit $5000?', False),
+    ('Will Ethereum reach $10,000 by end of year?', False),
+    ('Will Evelyn Matthei win the Chilean presidential election?', True),
+    ('Will Faroe Islands win on 2025-11-14?', False),
+    ('Will Franco Parisi win the Chilean presidential election?', True),
+    ('Will Gibraltar vs. Montenegro end in a draw?', False),
+    ('Will Gold close above $5000', False),
+    ('Will Iran strike Israel before July?', True),
+    ('Will Israel annex any territory by December 31?', True),
+    ('Will Israel strike 3 countries in November 2025?', True),
+    ('Will Israel strike Gaza on November 16?', True),
+    ('Will Italy invade Albania by 2026?', True),
+    ('Will Italy win on 2025-11-13?', False),
+    ('Will Jamaica win on 2025-11-13?', False),
+    ("Will Japan's prime minister resign?", True),
+    ('Will José Antonio Kast win the Chilean presidential election?', True),
+    ('Will Kazakhstan vs. Belgium end in a draw?', False),
+    ('Will Luxembourg vs. Germany end in a draw?', False),
+    ('Will Luxembourg win on 2025-11-14?', False),
+    ('Will Microsoft be the largest company in the world?', False),
+    ('Will Miss Universe be from Canada?', False),
+    ('Will Modi win the Indian election?', False),
+    ('Will Morocco vs. Mozambique end in a draw?', False),
+    ("Will MrBeast's trap video get 65 million views?", False),
+    ('Will Northern Ireland win on 2025-11-17?', False),
+    ('Will Putin meet Zelenskyy?', True),
+    ('Will Putin meet with Zelenskyy in 2025?', True),
+    ('Will Russia capture Pokrovsk by November 30?', True),
+    ('Will SOL dip to $130 November 10-16?', False),
+    ('Will SOL hit $200 in November?', False),
+    ('Will Solana dip to $130 November 10-16?', False),
+    ('Will Suriname win on 2025-11-13?', False),
+    ('Will Team Liquid win the IEM Cologne 2025?', False),
+    ('Will Tesla close at $250-$260 on Friday?', False),
+    ('Will The Weeknd be the most streamed Spotify artist?', False),
+    ('Will Trump say "tariff" during the press briefing?', False),
+    ('Will Trump talk to Volodymyr Zelenskyy in November?', True),
+    ('Will Trump win the 2024 Presidential Election?', True),
+    ('Will US GDP growth exceed 3% in 2025?', True),
+    ('Will Ukraine and Russia agree to a ceasefire in 2025?', True),
+    ('Will X hit $150,000 by December?', False),
+    ('Will global temperature increase by 1.5°C in 2025?', False),
+    ('Will gold close between $3500 and $3600?', False),
+    ('Will it rain in London tomorrow?', True),
+    ('Will the Cowboys make the playoffs?', False),
+    ('Will the Cowboys win the NFC East?', False),
+    ('Will the ECB announce no change at the December meeting?', True),
+    ('Will the EU impose new tariffs on US goods in 2025?', True),
+    ('Will the Fed cut rates in March?', True),
+    ('Will the Fed raise interest rates in Q1 2025?', False),
+    ('Will the Lakers win the NBA championship?', False),
+    ('Will the NATO summit approve new members?', True),
+    ('Will the Senate confirm the new Supreme Court nominee?', True),
+    ('Will the White House briefing be 5-10 minutes late?', False),
+    ('Will the price of Bitcoin be above $96,000 on November 17?', False),
+    ('Will the price of Bitcoin be between $96,000 and $98,000', False),
+    ('Will the price of Ethereum be less than $3,000 on November 16?', False),
+    ('Will the price of Solana be above $140 on November 20?', False),
+    ('Will the price of XRP be above $2.20 on November 21?', False),
+    ('Will there be a ceasefire in Gaza by March 2025?', True),
+    ('XRP Up or Down on November 15?', False),
+    ('XRP all time high by December 31?', False),
+    ("Yale Bulldogs vs. St. John's Red Storm", False),
+]
+
+
+class TestResults:
+    def __init__(self):
+        self.tests_run = 0
+        self.tests_passed = 0
+        self.tests_failed = 0
+        self.failures = []
+
+    def ok(self, name: str):
+        self.tests_run += 1
+        self.tests_passed += 1
+        print(f"  [PASS] {name}")
+
+    def fail(self, name: str, reason: str):
+        self.tests_run += 1
+        self.tests_failed += 1
+        self.failures.append((name, reason))
+        print(f"  [FAIL] {name}: {reason}")
+
+    def check(self, name: str, cond: bool, reason: str = ""):
+        if cond:
+            self.ok(name)
+        else:
+            self.fail(name, reason or "condition was False")
+
+    def summary(self) -> bool:
+        print(f"\n{'='*70}")
+        print(f"  TEST SUMMARY")
+        print(f"{'='*70}")
+        print(f"  Tests run    : {self.tests_run}")
+        pct = self.tests_passed / max(1, self.tests_run) * 100
+        print(f"  Passed       : {self.tests_passed}  ({pct:.0f}%)")
+        print(f"  Failed       : {self.tests_failed}")
+        if self.failures:
+            print(f"\n  FAILURES:")
+            for name, reason in self.failures:
+                print(f"    - {name}: {reason}")
+        print(f"{'='*70}")
+        return self.tests_failed == 0
+
+
+def _quiet_include(title: str, event_category=None) -> bool:
+    # The filter logs every keyword hit; keep the test output readable.
+    with contextlib.redirect_stdout(io.StringIO()):
+        return should_include_market(title, event_category)
+
+
+def _section_1(r: TestResults):
+    print("\n--- T1: golden include/exclude verdicts ---")
+    for title, expected in GOLDEN:
+        got = _quiet_include(title)
+        r.check(f"T1 {title[:60]}", got == expected,
+                f"expected include={expected}, got {got}")
+
+
+def _section_2(r: TestResults):
+    print("\n--- T2: alternation regex == substring loop ---")
+    for title, _ in GOLDEN:
+        title_lower = title.lower()
+        loop_hit = any(kw in title_lower for kw in EXCLUSION_KEYWORDS)
+        re_hit = EXCLUSION_KEYWORD_RE.search(title_lower) is not None
+        r.check(f"T2 {title[:60]}", loop_hit == re_hit,
+                f"loop={loop_hit} regex={re_hit}")
+
+
+def _section_3(r: TestResults):
+    print("\n--- T3: category gate overrides keyword scan ---")
+    r.check("T3a HARD_INCLUDE keeps a keyword-excluded title",
+            _quiet_include("Bitcoin Up or Down - November 14", "Geopolitics") is True)
+    r.check("T3b HARD_EXCLUDE drops a geopolitics title",
+            _quiet_include("Will Russia capture Pokrovsk by November 30?", "Sports") is False)
+    r.check("T3c trailing whitespace in category is stripped",
+            _quiet_include("Bitcoin Up or Down - November 14", "Elections ") is True)
+
+
+def _section_4(r: TestResults):
+    print("\n--- T4: combined structural regex == per-pattern loop ---")
+    probes = [
+        "Exact Score: Arsenal 2 - 1 Chelsea?",
+        "Map 2: Team Liquid vs NaVi",
+        "Will Trump say \"tariff\" during the press conference?",
+        "Will the briefing be 5-10 minutes late?",
+        "Will Elon post 100-124 posts from May 1 to May 8?",
+        "Will Bitcoin hit (high) $120k in June?",
+        "Caleb Williams drafted 1st overall?",
+        "NHL Presidents' Trophy winner",
+        "Will the ECB cut rates in June?",
+    ]
+    for title in [t for t, _ in GOLDEN] + probes:
+        title_lower = title.lower()
+        loop_hit = any(re.search(p, title_lower) for p in _SPORT_PATTERNS)
+        re_hit = SPORT_PATTERN_RE.search(title_lower) is not None
+        r.check(f"T4 {title[:60]}", loop_hit == re_hit,
+                f"loop={loop_hit} regex={re_hit}")
+
+
+def _section_5(r: TestResults):
+    print("\n--- T5: should_include_market memoisation ---")
+    title = "Bitcoin Up or Down - November 14, 6:00PM-6:15PM ET"
+    first = _quiet_include(title)
+    hits_before = should_include_market.cache_info().hits
+    second = _quiet_include(title)
+    r.check("T5a repeat call returns the same verdict", first == second,
+            f"first={first} second={second}")
+    r.check("T5b repeat call is served from the cache",
+            should_include_market.cache_info().hits == hits_before + 1,
+            f"cache_info={should_include_market.cache_info()}")
+    r.check("T5c category is part of the cache key",
+            _quiet_include(title, "Geopolitics") is True and first is False)
+
+
+def run_tests() -> bool:
+    r = TestResults()
+    _section_1(r)
+    _section_2(r)
+    _section_3(r)
+    _section_4(r)
+    _section_5(r)
+    return r.summary()
+
+
+if __name__ == "__main__":
+    success = run_tests()
+    sys.exit(0 if success else 1)